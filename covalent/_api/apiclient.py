@@ -19,11 +19,40 @@
 
 import json
 import os
-from typing import Dict
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator
 
 import requests
 from requests.adapters import HTTPAdapter
 
+# Maximum number of pooled connections kept alive per host
+_POOL_MAXSIZE = 32
+
+_session_local = threading.local()
+
+
+def _get_pooled_session() -> requests.Session:
+    """Return a keep-alive session shared by all API calls made from the current thread."""
+
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session_local.session = session
+
+    return session
+
+
+@lru_cache(maxsize=8)
+def _parse_extra_headers(data: str) -> Dict:
+    """Parse the JSONified extra headers, once per distinct value."""
+
+    return json.loads(data)
+
 
 class CovalentAPIClient:
     """Thin wrapper around Requests to centralize error handling."""
@@ -33,6 +62,22 @@ class CovalentAPIClient:
         self.adapter = adapter
         self.auto_raise = auto_raise
 
+    @contextmanager
+    def _session(self) -> Iterator[requests.Session]:
+        """Yield the session to issue a request with.
+
+        A custom adapter (e.g. with a retry policy) gets a dedicated
+        session, otherwise the thread's pooled session is reused so that
+        connections are kept alive across requests.
+        """
+
+        if self.adapter:
+            with requests.Session() as session:
+                session.mount("http://", self.adapter)
+                yield session
+        else:
+            yield _get_pooled_session()
+
     def prepare_headers(self, **kwargs):
         extra_headers = CovalentAPIClient.get_extra_headers()
         headers = kwargs.get("headers", {})
@@ -45,10 +90,7 @@ class CovalentAPIClient:
         headers = self.prepare_headers(**kwargs)
         url = self.dispatcher_addr + endpoint
         try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-
+            with self._session() as session:
                 r = session.get(url, headers=headers, **kwargs)
 
             if self.auto_raise:
@@ -65,10 +107,7 @@ class CovalentAPIClient:
         headers = self.prepare_headers()
         url = self.dispatcher_addr + endpoint
         try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-
+            with self._session() as session:
                 r = session.put(url, headers=headers, **kwargs)
 
             if self.auto_raise:
@@ -84,10 +123,7 @@ class CovalentAPIClient:
         headers = self.prepare_headers()
         url = self.dispatcher_addr + endpoint
         try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-
+            with self._session() as session:
                 r = session.post(url, headers=headers, **kwargs)
 
             if self.auto_raise:
@@ -103,10 +139,7 @@ class CovalentAPIClient:
         headers = self.prepare_headers()
         url = self.dispatcher_addr + endpoint
         try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-
+            with self._session() as session:
                 r = session.delete(url, headers=headers, **kwargs)
 
             if self.auto_raise:
@@ -123,6 +156,6 @@ class CovalentAPIClient:
         # This is expected to be a JSONified dictionary
         data = os.environ.get("COVALENT_EXTRA_HEADERS")
         if data:
-            return json.loads(data)
+            return dict(_parse_extra_headers(data))
         else:
             return {}
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import wraps
 from pathlib import Path
@@ -46,6 +47,9 @@ log_stack_info = logger.log_stack_info
 dispatch_cache_dir = Path(get_config("sdk.dispatch_cache_dir"))
 dispatch_cache_dir.mkdir(parents=True, exist_ok=True)
 
+# Maximum number of assets uploaded concurrently
+MAX_UPLOAD_WORKERS = 8
+
 
 def get_redispatch_request_body_v2(
     dispatch_id: str,
@@ -597,16 +601,26 @@ class LocalDispatcher(BaseDispatcher):
     def _upload(assets: List[AssetSchema]):
         local_scheme_prefix = "file://"
         total = len(assets)
-        for i, asset in enumerate(assets):
-            if not asset.remote_uri:
-                app_log.debug(f"Skipping asset {i+1} out of {total}")
-                continue
+
+        def _upload_one(i: int, asset: AssetSchema):
             if asset.remote_uri.startswith(local_scheme_prefix):
                 copy_file_locally(asset.uri, asset.remote_uri)
             else:
                 _upload_asset(asset.uri, asset.remote_uri)
             app_log.debug(f"uploaded {i+1} out of {total} assets.")
 
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as pool:
+            futures = []
+            for i, asset in enumerate(assets):
+                if not asset.remote_uri:
+                    app_log.debug(f"Skipping asset {i+1} out of {total}")
+                    continue
+                futures.append(pool.submit(_upload_one, i, asset))
+
+            # Wait for all uploads, propagating any errors
+            for future in futures:
+                future.result()
+
 
 def _upload_asset(local_uri, remote_uri):
     scheme_prefix = "file://"
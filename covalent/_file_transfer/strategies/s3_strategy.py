@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib.util
 import os
+import sys
 
 from furl import furl
 
@@ -26,6 +28,15 @@ app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
 
+def _get_boto_options(profile=None, region=None):
+    boto_options = {}
+    if profile:
+        boto_options["profile_name"] = profile
+    if region:
+        boto_options["region_name"] = region
+    return boto_options
+
+
 class S3(FileTransferStrategy):
 
     """
@@ -37,9 +48,9 @@ class S3(FileTransferStrategy):
         self.profile = profile
         self.region_name = region_name
 
-        try:
-            import boto3
-        except ImportError:
+        # Only check that boto3 is available; importing it is deferred to the
+        # transfer callables, which are the only place it is used.
+        if "boto3" not in sys.modules and importlib.util.find_spec("boto3") is None:
             raise ImportError(
                 "Using S3 strategy requires boto3 from AWS installed on your system."
             )
@@ -66,14 +77,6 @@ class S3(FileTransferStrategy):
         executor_profile = self.profile
         executor_region = self.region_name
 
-        def get_boto_options(profile=None, region=None):
-            boto_options = {}
-            if profile:
-                boto_options["profile_name"] = profile
-            if region:
-                boto_options["region_name"] = region
-            return boto_options
-
         if from_file._is_dir:
 
             def callable():
@@ -84,7 +87,7 @@ class S3(FileTransferStrategy):
 
                 profile = executor_profile
                 region = executor_region
-                s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
+                s3 = boto3.Session(**_get_boto_options(profile, region)).client("s3")
 
                 for obj_metadata in s3.list_objects(Bucket=bucket_name, Prefix=from_filepath)[
                     "Contents"
@@ -110,7 +113,7 @@ class S3(FileTransferStrategy):
 
                 profile = executor_profile
                 region = executor_region
-                s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
+                s3 = boto3.Session(**_get_boto_options(profile, region)).client("s3")
 
                 s3.download_file(bucket_name, from_filepath, to_filepath)
 
@@ -133,14 +136,6 @@ class S3(FileTransferStrategy):
         executor_profile = self.profile
         executor_region = self.region_name
 
-        def get_boto_options(profile=None, region=None):
-            boto_options = {}
-            if profile:
-                boto_options["profile_name"] = profile
-            if region:
-                boto_options["region_name"] = region
-            return boto_options
-
         if from_file._is_dir:
 
             def callable():
@@ -152,7 +147,7 @@ class S3(FileTransferStrategy):
 
                 profile = executor_profile
                 region = executor_region
-                s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
+                s3 = boto3.Session(**_get_boto_options(profile, region)).client("s3")
 
                 for dir_, _, files in os.walk(from_filepath):
                     for file_name in files:
@@ -171,7 +166,7 @@ class S3(FileTransferStrategy):
 
                 profile = executor_profile
                 region = executor_region
-                s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
+                s3 = boto3.Session(**_get_boto_options(profile, region)).client("s3")
 
                 s3.upload_file(from_filepath, bucket_name, to_filepath)
 
@@ -19,9 +19,13 @@ from __future__ import annotations
 
 import contextlib
 import os
+import shutil
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import requests
 from furl import furl
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
@@ -48,6 +52,13 @@ app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
 
+# Maximum number of node assets downloaded concurrently
+MAX_DOWNLOAD_WORKERS = 16
+
+# Fetch node assets from the dispatcher in a single request per asset key
+# unless COVALENT_DISABLE_BULK_ASSET_DOWNLOADS=1
+BULK_ASSET_DOWNLOADS = os.environ.get("COVALENT_DISABLE_BULK_ASSET_DOWNLOADS") != "1"
+
 SDK_NODE_META_KEYS = {
     "executor",
     "executor_data",
@@ -202,10 +213,21 @@ def _get_default_assets(rm: ResultManager):
     tg.lattice_metadata = rm.result_object.lattice.metadata
     rm.result_object.lattice.__doc__ = rm.result_object.lattice.__dict__.pop("doc")
 
-    for key in ELECTRON_ASSET_TYPES.keys():
-        if key not in DEFERRED_KEYS:
-            for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, key)
+    # Download the next key's node assets while loading the current ones
+    node_ids = list(tg._graph.nodes)
+    keys = [key for key in ELECTRON_ASSET_TYPES.keys() if key not in DEFERRED_KEYS]
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        pending = None
+        for i, key in enumerate(keys):
+            if pending is None:
+                rm.download_node_assets(node_ids, key)
+            else:
+                pending.result()
+
+            if i + 1 < len(keys):
+                pending = prefetcher.submit(rm.download_node_assets, node_ids, keys[i + 1])
+
+            for node_id in node_ids:
                 rm.load_node_asset(node_id, key)
 
 
@@ -246,6 +268,58 @@ def download_asset(remote_uri: str, local_path: str, chunk_size: int = 1024 * 10
                 f.write(chunk)
 
 
+def _get_bulk_node_asset_endpoint(remote_uris: Iterable[str]) -> Optional[Tuple[str, str]]:
+    """Find the dispatcher endpoint serving all the given node assets at once.
+
+    Node assets served by the dispatcher have URIs of the form
+    `<addr>/api/v2/dispatches/<dispatch_id>/electrons/<node_id>/assets/<key>`
+    and can be fetched together from
+    `<addr>/api/v2/dispatches/<dispatch_id>/electrons/assets/<key>`.
+
+    Returns:
+        The dispatcher address and endpoint, or None if the assets
+        are not all served by the same bulk endpoint.
+    """
+    endpoints = set()
+    for remote_uri in remote_uris:
+        f = furl(remote_uri)
+        segments = list(f.path.segments)
+        if (
+            f.scheme not in ("http", "https")
+            or len(segments) < 4
+            or segments[-4] != "electrons"
+            or segments[-2] != "assets"
+        ):
+            return None
+        del segments[-3]
+        endpoints.add((f"{f.scheme}://{f.host}:{f.port}", "/" + "/".join(segments)))
+
+    return endpoints.pop() if len(endpoints) == 1 else None
+
+
+def download_node_assets_bulk(
+    dispatcher_addr: str,
+    endpoint: str,
+    local_paths: Dict[int, str],
+    chunk_size: int = 1024 * 1024,
+):
+    """Download an asset for several nodes in a single request.
+
+    Args:
+        dispatcher_addr: The dispatcher address.
+        endpoint: The bulk node asset endpoint.
+        local_paths: A mapping from node ids to local destination paths.
+        chunk_size: The size of each chunk written to disk.
+    """
+    api_client = CovalentAPIClient(dispatcher_addr)
+    r = api_client.post(endpoint, json=list(local_paths), stream=True)
+    r.raw.decode_content = True
+    with tarfile.open(fileobj=r.raw, mode="r|") as archive:
+        for member in archive:
+            with open(local_paths[int(member.name)], "wb") as f:
+                shutil.copyfileobj(archive.extractfile(member), f, chunk_size)
+
+
 def _download_result_asset(manifest: dict, results_dir: str, key: str):
     remote_uri = manifest["assets"][key]["remote_uri"]
     local_path = get_result_asset_path(results_dir, key)
@@ -314,6 +388,56 @@ class ResultManager:
     def download_node_asset(self, node_id: int, key: str):
         _download_node_asset(self._manifest, self._results_dir, node_id, key)
 
+    def download_node_assets(self, node_ids: Iterable[int], key: str):
+        """Download an asset for several nodes concurrently.
+
+        Args:
+            node_ids: The nodes whose asset to download.
+            key: The asset key.
+        """
+
+        node_ids = list(node_ids)
+        if not node_ids:
+            return
+
+        if BULK_ASSET_DOWNLOADS and self._download_node_assets_bulk(node_ids, key):
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(node_ids))) as pool:
+            # Consume the iterator to propagate any download errors
+            list(pool.map(lambda node_id: self.download_node_asset(node_id, key), node_ids))
+
+    def _download_node_assets_bulk(self, node_ids: List[int], key: str) -> bool:
+        """Try to download an asset for several nodes in a single request.
+
+        Returns:
+            Whether the assets were downloaded. Assets not served by a
+            dispatcher, or by one without a bulk endpoint, are not.
+        """
+        nodes = self._manifest["lattice"]["transport_graph"]["nodes"]
+        node_assets = {node_id: nodes[node_id]["assets"] for node_id in node_ids}
+        bulk_endpoint = _get_bulk_node_asset_endpoint(
+            assets[key]["remote_uri"] for assets in node_assets.values()
+        )
+        if not bulk_endpoint:
+            return False
+
+        local_paths = {
+            node_id: get_node_asset_path(self._results_dir, node_id, key) for node_id in node_ids
+        }
+        try:
+            download_node_assets_bulk(*bulk_endpoint, local_paths)
+        except requests.HTTPError as e:
+            if e.response.status_code not in (404, 405):
+                raise
+            app_log.debug("Bulk asset downloads are not supported by the dispatcher")
+            return False
+
+        for node_id, assets in node_assets.items():
+            assets[key]["uri"] = f"file://{local_paths[node_id]}"
+
+        return True
+
     def load_result_asset(self, key: str):
         data = _load_result_asset(self._manifest, key)
         self.result_object.__dict__[f"_{key}"] = data
@@ -418,8 +542,8 @@ def _get_result_multistage(
 
         if intermediate_outputs:
             tg = rm.result_object.lattice.transport_graph
+            rm.download_node_assets(tg._graph.nodes, "output")
             for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, "output")
                 rm.load_node_asset(node_id, "output")
 
         # Fetch sublattice result objects recursively
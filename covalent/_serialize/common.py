@@ -163,5 +163,8 @@ def load_asset(asset_meta: AssetSchema, data_type: AssetType) -> Any:
     path = uri[len(scheme_prefix) :] if uri.startswith(scheme_prefix) else uri
 
     with open(path, "rb") as f:
+        if data_type == AssetType.OBJECT:
+            # Unpickle straight from the file instead of reading it into memory first
+            return cloudpickle.load(f)
         data = f.read()
     return deserialize_asset(data, data_type)
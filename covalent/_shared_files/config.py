@@ -21,13 +21,36 @@ from dataclasses import asdict
 from functools import reduce
 from operator import getitem
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import filelock
 import toml
 
 """Configuration manager."""
 
+# Callbacks invoked whenever the in-memory configuration changes, e.g. to
+# invalidate values cached from the configuration
+_config_change_hooks: List[Callable[[], None]] = []
+
+
+def add_config_change_hook(hook: Callable[[], None]) -> None:
+    """
+    Register a callback to be invoked whenever the configuration changes.
+
+    Args:
+        hook: A callable taking no arguments.
+
+    Returns:
+        None
+    """
+
+    _config_change_hooks.append(hook)
+
+
+def _notify_config_change() -> None:
+    for hook in _config_change_hooks:
+        hook()
+
 
 class ConfigManager:
     """
@@ -72,6 +95,7 @@ class ConfigManager:
         from .defaults import DefaultConfig
 
         self.config_data = asdict(DefaultConfig())
+        _notify_config_change()
 
     def update_config(
         self, new_entries: Optional[Dict] = None, override_existing: bool = True
@@ -117,6 +141,8 @@ class ConfigManager:
                 # Writing it back to the file
                 self.write_config()
 
+        _notify_config_change()
+
     def read_config(self) -> None:
         """
         Read the configuration from file.
@@ -129,6 +155,7 @@ class ConfigManager:
         """
 
         self.config_data = toml.load(self.config_file)
+        _notify_config_change()
 
     def write_config(self) -> None:
         """
@@ -195,6 +222,8 @@ class ConfigManager:
                 data = data[key]
             data[keys[-1]] = value
 
+        _notify_config_change()
+
 
 _config_manager = ConfigManager()
 
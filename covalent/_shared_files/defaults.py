@@ -120,8 +120,16 @@ def get_default_dispatcher_config():
             "heartbeat",
         ),
         "use_async_dispatcher": os.environ.get("COVALENT_USE_ASYNC_DISPATCHER", "true") or "false",
+        "use_uvloop": os.environ.get("COVALENT_USE_UVLOOP", "true") or "false",
+        "max_concurrent_dispatch_startups": int(
+            os.environ.get("COVALENT_MAX_CONCURRENT_DISPATCH_STARTUPS", 32)
+        ),
         "data_uri_filter_policy": os.environ.get("COVALENT_DATA_URI_FILTER_POLICY", "http"),
         "asset_cache_size": int(os.environ.get("COVALENT_ASSET_CACHE_SIZE", 32)),
+        "db_pool_size": int(os.environ.get("COVALENT_DB_POOL_SIZE", 20)),
+        "db_max_overflow": int(os.environ.get("COVALENT_DB_MAX_OVERFLOW", 40)),
+        "db_pool_timeout": int(os.environ.get("COVALENT_DB_POOL_TIMEOUT", 30)),
+        "db_pool_recycle": int(os.environ.get("COVALENT_DB_POOL_RECYCLE", 1800)),
     }
 
 
@@ -16,14 +16,16 @@
 
 """QNode and QElectron information containers."""
 
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional, Sequence, Union
 
-from pydantic import BaseModel  # pylint: disable=no-name-in-module
 
-
-class QNodeSpecs(BaseModel):
+@dataclass(frozen=True)
+class QNodeSpecs:
     """
     A container for the specifications of a QNode generated by `qml.specs`.
+
+    Instances are immutable, so they can be shared between executors.
     """
 
     gate_sizes: Dict[int, int]
@@ -33,7 +35,6 @@ class QNodeSpecs(BaseModel):
     num_diagonalizing_gates: int
     num_used_wires: int
     depth: int
-    num_trainable_params: int = None
     num_device_wires: int
     device_name: str
     diff_method: Optional[str]
@@ -41,22 +42,56 @@ class QNodeSpecs(BaseModel):
     gradient_options: Dict[str, int]
     interface: Optional[str]
     gradient_fn: Any  # can be string or `qml.gradients.gradient_transform`
+    num_trainable_params: int = None
     num_gradient_executions: Any = 0
     num_parameter_shift_executions: int = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QNodeSpecs":
+        """
+        Create an instance from a dictionary, ignoring any unknown keys.
+        """
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
 
-class QElectronInfo(BaseModel):
+    @classmethod
+    def unchecked(cls, **data) -> "QNodeSpecs":
+        """
+        Create an instance from trusted, internally generated data, e.g. the
+        output of `qml.specs`.
+        """
+        return cls.from_dict(data)
+
+
+@dataclass(frozen=True)
+class QElectronInfo:
     """
     A container for global and QNode device settings.
+
+    Instances are immutable, so they can be shared between executors.
     """
 
     name: str
-    description: Optional[str] = None
     device_name: str  # name of the original device, e.g. "default.qubit"
     device_import_path: str  # used to inherit type converters and other methods
     device_shots: Union[
         None, int, Sequence[int], Sequence[Union[int, Sequence[int]]]
     ]  # optional default for execution devices
-    device_shots_type: Any = None
     device_wires: int  # this can not be reliably inferred from tapes alone
     pennylane_active_return: bool  # client-side status of `pennylane.active_return()`
+    description: Optional[str] = None
+    device_shots_type: Any = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QElectronInfo":
+        """
+        Create an instance from a dictionary, ignoring any unknown keys.
+        """
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+    @classmethod
+    def unchecked(cls, **data) -> "QElectronInfo":
+        """
+        Create an instance from trusted, internally generated data, e.g.
+        attributes read from the original QNode.
+        """
+        return cls.from_dict(data)
@@ -18,16 +18,21 @@
 
 import importlib
 import inspect
+import re
 import shutil
 import socket
+import weakref
 from datetime import timedelta
+from functools import lru_cache
+from types import CodeType, FunctionType, ModuleType
 from typing import Any, Callable, Dict, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
 import cloudpickle
 from pennylane._device import Device
 
 from . import logger
-from .config import get_config
+from .config import add_config_change_hook, get_config
 from .pickling import _qml_mods_pickle
 
 app_log = logger.app_log
@@ -42,6 +47,19 @@ _address_client_mapper = {}
 
 _IMPORT_PATH_SEPARATOR = ":"
 
+# Time limit strings have the form "DD-HH:MM:SS"
+_TIME_LIMIT_RE = re.compile(r"(\d+)-(\d+):(\d+):(\d+)")
+
+# Names of the Covalent decorators that are detected as workflow imports
+_WORKFLOW_DECORATOR_NAMES = frozenset({"lattice", "electron"})
+
+# Names of the Covalent-related imports that are commented out in workflow imports
+_COVALENT_IMPORT_NAMES = _WORKFLOW_DECORATOR_NAMES | {"covalent"}
+
+# Cache of `get_imports` results, keyed by function and fingerprinted by
+# the size of the function's globals
+_imports_cache = weakref.WeakKeyDictionary()
+
 
 def get_ui_url(path):
     baseUrl = f"http://{DEFAULT_UI_ADDRESS}:{DEFAULT_UI_PORT}"
@@ -51,12 +69,13 @@ def get_ui_url(path):
 def get_random_available_port() -> int:
     """
     Return a random port that is available on the machine
+
+    The port is only known to be free at the time of the call; another process
+    may bind it before the caller does.
     """
-    sock = socket.socket()
-    sock.bind(("127.0.0.1", 0))
-    port = sock.getsockname()[1]
-    sock.close()
-    return port
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
 
 
 def get_timedelta(time_limit: str) -> timedelta:
@@ -69,27 +88,12 @@ def get_timedelta(time_limit: str) -> timedelta:
         timedelta: The `datetime.timedelta` object.
     """
 
-    days, hours, minutes, seconds = time_limit.split("-")[0], *time_limit.split("-")[1].split(":")
-    return timedelta(
-        days=int(days),
-        hours=int(hours),
-        minutes=int(minutes),
-        seconds=int(seconds),
-    )
-
-
-def reformat(t: int) -> str:
-    """
-    Reformat an integer to a readable time-like string. For example, if t = 1, return "01".
-
-     Args:
-         t: The integer to reformat.
-
-     Returns:
-         ref_string: The reformatted string.
-    """
+    match = _TIME_LIMIT_RE.match(time_limit)
+    if match is None:
+        raise ValueError(f"Invalid time limit {time_limit}, expected format DD-HH:MM:SS")
 
-    return f"0{t}" if len(str(t)) == 1 else str(t)
+    days, hours, minutes, seconds = map(int, match.groups())
+    return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
 
 
 def get_time(time_delta: timedelta) -> str:
@@ -102,11 +106,9 @@ def get_time(time_delta: timedelta) -> str:
         time_string: The compatible reformatted time string.
     """
 
-    days = reformat(time_delta.days)
-    hours = reformat(time_delta.seconds // 3600)
-    minutes = reformat((time_delta.seconds // 60) % 60)
-    seconds = reformat(time_delta.seconds % 60)
-    return f"{days}-{hours}:{minutes}:{seconds}"
+    hours, remainder = divmod(time_delta.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{time_delta.days:02d}-{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def filter_null_metadata(meta_dict: dict) -> Dict:
@@ -114,6 +116,16 @@ def filter_null_metadata(meta_dict: dict) -> Dict:
     return {k: v for k, v in meta_dict.items() if v}
 
 
+@lru_cache(maxsize=1024)
+def _get_source(code: CodeType, filename: str) -> str:
+    """
+    Return the (cached) source of a code object. Code objects compare by
+    value, so a function re-created by deserialization hits the entry of
+    the original; the filename tells apart identical code in other files.
+    """
+    return inspect.getsource(code)
+
+
 def get_serialized_function_str(function):
     """
     Generates a string representation of a function definition
@@ -134,7 +146,11 @@ def get_serialized_function_str(function):
 
     try:
         # function_str is the string representation of one function, with decorators, if any.
-        function_str = inspect.getsource(input_function)
+        code = getattr(inspect.unwrap(input_function), "__code__", None)
+        if code is not None:
+            function_str = _get_source(code, code.co_filename)
+        else:
+            function_str = inspect.getsource(input_function)
     except Exception:
         function_str = f"# {function.__name__} was not inspectable"
 
@@ -154,26 +170,44 @@ def get_imports(func: Callable) -> Tuple[str, Set[str]]:
             Covalent-related modules have been imported as.
     """
 
+    fingerprint = len(func.__globals__)
+    cached = _imports_cache.get(func)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1], set(cached[2])
+
     imports_str = ""
     cova_imports = set()
     for i, j in func.__globals__.items():
-        if inspect.ismodule(j) or (
-            inspect.isfunction(j) and j.__name__ in ["lattice", "electron"]
+        if isinstance(j, ModuleType) or (
+            isinstance(j, FunctionType) and j.__name__ in _WORKFLOW_DECORATOR_NAMES
         ):
             if j.__name__ == i:
                 import_line = f"import {j.__name__}\n"
             else:
                 import_line = f"import {j.__name__} as {i}\n"
 
-            if j.__name__ in ["covalent", "lattice", "electron"]:
+            if j.__name__ in _COVALENT_IMPORT_NAMES:
                 import_line = f"# {import_line}"
                 cova_imports.add(i)
 
             imports_str += import_line
 
+    _imports_cache[func] = (fingerprint, imports_str, frozenset(cova_imports))
     return imports_str, cova_imports
 
 
+@lru_cache(maxsize=4096)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Return the (cached) signature of a callable."""
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=4096)
+def _get_param_kinds(func: Callable) -> Tuple[Tuple[str, Any], ...]:
+    """Return the (cached) names and kinds of a callable's parameters, in order."""
+    return tuple((name, param.kind) for name, param in _cached_signature(func).parameters.items())
+
+
 def required_params_passed(func: Callable, kwargs: Dict) -> bool:
     """
     DEPRECATED: Check to see that values for all parameters without default values have been passed.
@@ -187,7 +221,7 @@ def required_params_passed(func: Callable, kwargs: Dict) -> bool:
     """
 
     required_arg_set = set({})
-    sig = inspect.signature(func)
+    sig = _cached_signature(func)
     for param in sig.parameters.values():
         if param.default is param.empty:
             required_arg_set.add(str(param))
@@ -196,26 +230,35 @@ def required_params_passed(func: Callable, kwargs: Dict) -> bool:
 
 
 def get_named_params(func, args, kwargs):
-    ordered_params_dict = inspect.signature(func).parameters
-
     named_args = {}
     named_kwargs = {}
+    keyword_only_names = set()
+    accepts_var_keyword = False
 
-    for ind, parameter_dict in enumerate(ordered_params_dict.items()):
-        param_name, param = parameter_dict
-
-        if param.kind in [param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD]:
+    for ind, (param_name, kind) in enumerate(_get_param_kinds(func)):
+        if kind in [inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD]:
             if param_name in kwargs:
                 named_kwargs[param_name] = kwargs[param_name]
             elif ind < len(args):
                 named_args[param_name] = args[ind]
-        elif param.kind == param.VAR_POSITIONAL:
+        elif kind == inspect.Parameter.VAR_POSITIONAL:
             for i in range(ind, len(args)):
                 named_args[f"arg[{i}]"] = args[i]
-        elif param.kind in [param.KEYWORD_ONLY, param.VAR_KEYWORD]:
-            for key, value in kwargs.items():
-                if key != param_name:
-                    named_kwargs[key] = value
+        elif kind == inspect.Parameter.KEYWORD_ONLY:
+            keyword_only_names.add(param_name)
+        elif kind == inspect.Parameter.VAR_KEYWORD:
+            accepts_var_keyword = True
+
+    # Remaining kwargs are matched against keyword-only parameters or
+    # absorbed by **kwargs in a single pass.
+    if keyword_only_names or accepts_var_keyword:
+        named_kwargs.update(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if accepts_var_keyword or key in keyword_only_names
+            }
+        )
 
     if len(args) > len(named_args):
         raise ValueError(
@@ -229,24 +272,40 @@ def get_named_params(func, args, kwargs):
     return (named_args, named_kwargs)
 
 
-def format_server_url(hostname: str = None, port: int = None) -> str:
-    if hostname is None:
-        hostname = get_config("dispatcher.address")
-    if port is None:
-        port = int(get_config("dispatcher.port"))
+@lru_cache(maxsize=16)
+def _build_server_url(hostname: str, port: int) -> str:
+    """Return the (cached) server URL for a hostname and port."""
 
     url = hostname
     if not url.startswith("http"):
         url = f"https://{url}" if port == 443 else f"http://{url}"
 
     # Inject port
-    if port not in [80, 443]:
-        parts = url.split("/")
-        url = "".join(["/".join(parts[:3])] + [f":{port}/"] + ["/".join(parts[3:])])
+    if port not in (80, 443):
+        parts = urlsplit(url)
+        url = urlunsplit(parts._replace(netloc=f"{parts.netloc}:{port}"))
 
     return url.strip("/")
 
 
+@lru_cache(maxsize=1)
+def _cached_dispatcher_endpoint() -> Tuple[str, int]:
+    """Return the (cached) dispatcher address and port from the config."""
+    return get_config("dispatcher.address"), int(get_config("dispatcher.port"))
+
+
+add_config_change_hook(_cached_dispatcher_endpoint.cache_clear)
+
+
+def format_server_url(hostname: str = None, port: int = None) -> str:
+    if hostname is None or port is None:
+        default_hostname, default_port = _cached_dispatcher_endpoint()
+        hostname = default_hostname if hostname is None else hostname
+        port = default_port if port is None else port
+
+    return _build_server_url(hostname, port)
+
+
 # For use by LocalDispatcher and ResultsManager when running Covalent
 # server locally
 def copy_file_locally(src_uri, dest_uri):
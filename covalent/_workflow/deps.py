@@ -49,7 +49,7 @@ class Deps(ABC):
         return (self.apply_fn, self.apply_args, self.apply_kwargs, self.retval_keyword)
 
     def short_name(self):
-        return self.__module__.split("/")[-1].split(".")[-1]
+        return self.__module__.rpartition("/")[2].rpartition(".")[2]
 
     @abstractmethod
     def to_dict(self):
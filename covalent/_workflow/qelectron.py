@@ -116,7 +116,7 @@ def get_qinfo(name: str, description: str, qnode: qml.QNode) -> QElectronInfo:
     device_shots = get_original_shots(qnode.device)
     device_shots_type = None if device_shots is None else type(device_shots)
 
-    return QElectronInfo(
+    return QElectronInfo.unchecked(
         name=name,
         description=description,
         device_name=qnode.device.short_name,
@@ -166,11 +166,11 @@ class QNodeQE(qml.QNode):
             any(qml.math.get_trainable_indices(args))
             or any(qml.math.get_trainable_indices(kwargs.values()))
         ):
-            specs = QNodeSpecs(**qml.specs(self)(*args, **kwargs))
+            specs = QNodeSpecs.unchecked(**qml.specs(self)(*args, **kwargs))
         else:
             # No trainable params. Avoid warning.
             with self.override_gradient_fn(None):
-                specs = QNodeSpecs(**qml.specs(self)(*args, **kwargs))
+                specs = QNodeSpecs.unchecked(**qml.specs(self)(*args, **kwargs))
 
             # Replace override value with actual `gradient_fn`.
             self.construct(args, kwargs)
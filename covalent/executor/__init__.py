@@ -21,13 +21,12 @@ Defines executors and provides a "manager" to get all available executors
 import contextlib
 import glob
 import importlib
-import inspect
+import importlib.metadata
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Union
-
-import pkg_resources
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
 
 from .._shared_files import logger
 from .._shared_files.config import get_config, update_config
@@ -39,6 +38,26 @@ log_stack_info = logger.log_stack_info
 
 _QUANTUM_PLUGINS_PATH = Path(__file__).parent / "quantum_plugins"
 _QUANTUM_DEFAULTS_VARNAME = "_QEXECUTOR_PLUGIN_DEFAULTS"
+_EXECUTOR_PLUGINS_ENTRY_POINT_GROUP = "covalent.executor.executor_plugins"
+
+
+def _get_entry_points(group: str) -> Iterable[importlib.metadata.EntryPoint]:
+    """
+    Return the installed entry points belonging to a group.
+
+    Args:
+        group: The entry point group name.
+
+    Returns:
+        An iterable of entry points.
+    """
+
+    entry_points = importlib.metadata.entry_points()
+
+    # Python < 3.10 returns a dictionary of entry points keyed by group
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=group)
+    return entry_points.get(group, [])
 
 
 class _ExecutorManager:
@@ -57,6 +76,9 @@ class _ExecutorManager:
         if os.environ.get("COVALENT_PLUGIN_LOAD", "true").lower() == "true":
             self.generate_plugins_list()
 
+        # The singleton's map was rebuilt, so refresh the module-level exports
+        _export_executor_plugins(self.executor_plugins_map)
+
     def __new__(cls):
         # Singleton pattern for this class
         if not hasattr(cls, "instance"):
@@ -136,18 +158,22 @@ class _ExecutorManager:
             app_log.error(message)
             raise TypeError
 
-    def _is_plugin_name_valid(self, the_module):
-        """Assert if the plugin variable name is valid"""
+    def _get_plugin_name(self, the_module: Any) -> Optional[str]:
+        """
+        Return the name of the plugin class defined by a module, if any.
 
-        plugin_name_var = "EXECUTOR_PLUGIN_NAME"
-        return bool(
-            hasattr(the_module, plugin_name_var) or hasattr(the_module, plugin_name_var.lower())
-        )
+        Args:
+            the_module: The module defining the plugin.
 
-    def nonzero_plugin_classes(self, plugin_class):
-        """Retrun true if any plugin classes are present"""
+        Returns:
+            The value of `executor_plugin_name` or `EXECUTOR_PLUGIN_NAME` in the module,
+            or None if neither is defined.
+        """
 
-        return bool(len(plugin_class))
+        executor_name = getattr(the_module, "executor_plugin_name", None) or getattr(
+            the_module, "EXECUTOR_PLUGIN_NAME", None
+        )
+        return executor_name if isinstance(executor_name, str) else None
 
     def _populate_executor_map_from_module(self, the_module: Any) -> None:
         """
@@ -161,28 +187,19 @@ class _ExecutorManager:
             None
         """
 
-        if not self._is_plugin_name_valid(the_module):
+        # The module should have a global attribute named EXECUTOR_PLUGIN_NAME
+        # which is set to the class name defining the plugin.
+        executor_name = self._get_plugin_name(the_module)
+        if executor_name is None:
             message = f"{the_module.__name__} does not seem to have a well-defined plugin class.\n"
             message += f"Specify the plugin class with 'EXECUTOR_PLUGIN_NAME = <plugin class name>' in the {the_module.__name__} module."
             app_log.warning(message)
             return
 
-        # All classes loaded by the module
-        all_classes = inspect.getmembers(the_module, inspect.isclass)
-        # Classes that are defined in the module:
-        module_classes = [c[1] for c in all_classes if c[1].__module__ == the_module.__name__]
-        # The module should have a global attribute named EXECUTOR_PLUGIN_NAME
-        # which is set to the class name defining the plugin.
-        executor_name = (
-            the_module.executor_plugin_name
-            if hasattr(the_module, "executor_plugin_name")
-            else the_module.EXECUTOR_PLUGIN_NAME
-        )
-        plugin_class = [c for c in module_classes if c.__name__ == executor_name]
-
-        if self.nonzero_plugin_classes(plugin_class):
-            plugin_class = plugin_class[0]
-            short_name = the_module.__name__.split("/")[-1].split(".")[-1]
+        # The plugin class must be defined in the module itself.
+        plugin_class = getattr(the_module, executor_name, None)
+        if isinstance(plugin_class, type) and plugin_class.__module__ == the_module.__name__:
+            short_name = the_module.__name__.rpartition("/")[2].rpartition(".")[2]
             self.executor_plugins_map[short_name] = plugin_class
 
             if hasattr(the_module, "_EXECUTOR_PLUGIN_DEFAULTS"):
@@ -193,11 +210,6 @@ class _ExecutorManager:
 
         else:
             # The requested plugin (the_module.module_name) was not found in the module.
-            executor_name = (
-                the_module.executor_plugin_name
-                if hasattr(the_module, "executor_plugin_name")
-                else the_module.EXECUTOR_PLUGIN_NAME
-            )
             message = (
                 f"Requested executor plugin {executor_name} was not found in {the_module.__name__}"
             )
@@ -215,8 +227,7 @@ class _ExecutorManager:
             None
         """
 
-        entry_points = pkg_resources.iter_entry_points("covalent.executor.executor_plugins")
-        for entry in entry_points:
+        for entry in _get_entry_points(_EXECUTOR_PLUGINS_ENTRY_POINT_GROUP):
             the_module = entry.load()
             self._populate_executor_map_from_module(the_module)
 
@@ -232,24 +243,53 @@ class _ExecutorManager:
             None
         """
 
+        # Modules are loaded one at a time: registering a plugin updates the config
+        # file under a file lock with a short timeout, and plugins importing the same
+        # heavy dependencies would serialize on the import lock anyway.
+        for module_file in self._get_plugin_module_files(executor_dir):
+            the_module = self._load_module(module_file)
+            self._populate_executor_map_from_module(the_module)
+
+    def _get_plugin_module_files(self, executor_dir: str) -> List[str]:
+        """
+        Find the candidate executor plugin modules in a directory.
+
+        Args:
+            executor_dir: Colon-separated list of directories to search.
+
+        Returns:
+            The paths of the Python modules found, excluding `__init__.py` files.
+        """
+
         dirs = set(executor_dir.split(":"))
 
-        for e_dir in dirs:
-            if os.path.exists(e_dir):
-                module_files = glob.glob(os.path.join(e_dir, "*.py"))
+        return [
+            module_file
+            for e_dir in dirs
+            if os.path.exists(e_dir)
+            for module_file in glob.glob(os.path.join(e_dir, "*.py"))
+            if not module_file.endswith("__init__.py")
+        ]
+
+    def _load_module(self, module_file: str) -> Any:
+        """
+        Import a module from a file.
+
+        Args:
+            module_file: Path of the module to import.
 
-                for module_file in module_files:
-                    if module_file.endswith("__init__.py"):
-                        continue
+        Returns:
+            The imported module.
+        """
 
-                    module_name = module_file[:-3]
+        module_name = module_file[:-3]
 
-                    # Import the module that contains the plugin
-                    module_spec = importlib.util.spec_from_file_location(module_name, module_file)
-                    the_module = importlib.util.module_from_spec(module_spec)
-                    module_spec.loader.exec_module(the_module)
+        # Import the module that contains the plugin
+        module_spec = importlib.util.spec_from_file_location(module_name, module_file)
+        the_module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(the_module)
 
-                    self._populate_executor_map_from_module(the_module)
+        return the_module
 
     def list_executors(self, regenerate: bool = False, print_names: bool = True) -> List[str]:
         """
@@ -265,15 +305,26 @@ class _ExecutorManager:
 
         if regenerate:
             self.generate_plugins_list()
+            _export_executor_plugins(self.executor_plugins_map)
 
-        executor_list = []
-        for n, name in enumerate(self.executor_plugins_map, start=1):
-            executor_list.append(name)
-            if print_names:
-                print(f"{n}. {name}")
+        executor_list = list(self.iter_executors())
+        if print_names and executor_list:
+            sys.stdout.write(
+                "\n".join(f"{n}. {name}" for n, name in enumerate(executor_list, start=1)) + "\n"
+            )
 
         return executor_list
 
+    def iter_executors(self) -> Iterator[str]:
+        """
+        Iterate over the names of the executors that are available.
+
+        Returns:
+            An iterator over executor names.
+        """
+
+        yield from self.executor_plugins_map
+
 
 class _QExecutorManager:
     """
@@ -369,12 +420,78 @@ class _QExecutorManager:
             )
 
 
-_executor_manager = _ExecutorManager()
-_qexecutor_manager = _QExecutorManager()
+_executor_manager_lock = threading.RLock()
+_executor_manager_loading = False
+
+# Names of the executor plugin classes currently exported as module attributes
+_exported_executor_names: Set[str] = set()
+
+
+def _export_executor_plugins(executor_plugins_map: Dict[str, Any]) -> None:
+    """
+    Export the executor plugin classes as attributes of this module, removing
+    those of plugins that are no longer in the executor map.
+
+    Args:
+        executor_plugins_map: Dictionary mapping executor name to executor class.
+
+    Returns:
+        None
+    """
+
+    plugin_classes = {
+        plugin_class.__name__: plugin_class for plugin_class in executor_plugins_map.values()
+    }
 
-for name in _executor_manager.executor_plugins_map:
-    plugin_class = _executor_manager.executor_plugins_map[name]
-    globals()[plugin_class.__name__] = plugin_class
+    for name in _exported_executor_names.difference(plugin_classes):
+        globals().pop(name, None)
+
+    globals().update(plugin_classes)
+    _exported_executor_names.clear()
+    _exported_executor_names.update(plugin_classes)
+
+
+def _load_executor_manager() -> None:
+    """
+    Create the executor manager, which exports the executor plugin classes as
+    attributes of this module.
+
+    Executor plugins are only loaded on first use, so that importing
+    `covalent.executor` does not import every plugin and its dependencies.
+    """
+
+    global _executor_manager_loading
+
+    with _executor_manager_lock:
+        # Plugin modules looking up missing names of this module while being
+        # loaded (by the same thread) must not trigger another load.
+        if "_executor_manager" in globals() or _executor_manager_loading:
+            return
+
+        _executor_manager_loading = True
+        try:
+            globals()["_executor_manager"] = _ExecutorManager()
+        finally:
+            _executor_manager_loading = False
+
+
+def __getattr__(name: str) -> Any:
+    # Only called for names missing from the module globals, i.e. the executor
+    # manager and plugin classes before the plugins are loaded.
+    if not name.startswith("__"):
+        _load_executor_manager()
+        if name in globals():
+            return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    _load_executor_manager()
+    return list(globals())
+
+
+_qexecutor_manager = _QExecutorManager()
 
 for qexecutor_cls in _qexecutor_manager.executor_plugins_map.values():
     globals()[qexecutor_cls.__name__] = qexecutor_cls
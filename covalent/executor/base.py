@@ -55,6 +55,23 @@ app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 TypeJSON = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 
+_IMMUTABLE_ATTRIBUTE_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an executor attributes dictionary, avoiding a deep copy when all values are immutable.
+
+    Args:
+        attributes: The executor attributes to copy.
+
+    Returns:
+        A copy of the attributes that shares no mutable state with the input.
+    """
+
+    if all(isinstance(v, _IMMUTABLE_ATTRIBUTE_TYPES) for v in attributes.values()):
+        return dict(attributes)
+    return copy.deepcopy(attributes)
+
 
 def wrapper_fn(
     function: TransportableObject,
@@ -71,44 +88,56 @@ def wrapper_fn(
 
     """
 
+    # Fast path for the common case of a task without deps
+    if not call_before and not call_after:
+        fn = function.get_deserialized()
+        new_args = [arg.get_deserialized() for arg in args]
+        new_kwargs = {k: v.get_deserialized() for k, v in kwargs.items()}
+        return TransportableObject(fn(*new_args, **new_kwargs))
+
+    # Deserialize each dep's TransportableObjects only once even if they are
+    # shared by several deps. The task's own function and arguments are not
+    # memoized, so an object passed twice yields two independent values.
+    deserialized_deps = {}
+
+    def _deserialize_dep(tobj: TransportableObject) -> Any:
+        key = id(tobj)
+        if key not in deserialized_deps:
+            deserialized_deps[key] = tobj.get_deserialized()
+        return deserialized_deps[key]
+
     cb_retvals = {}
     for tup in call_before:
         serialized_fn, serialized_args, serialized_kwargs, retval_key = tup
-        cb_fn = serialized_fn.get_deserialized()
-        cb_args = serialized_args.get_deserialized()
-        cb_kwargs = serialized_kwargs.get_deserialized()
+        cb_fn = _deserialize_dep(serialized_fn)
+        cb_args = _deserialize_dep(serialized_args)
+        cb_kwargs = _deserialize_dep(serialized_kwargs)
         retval = cb_fn(*cb_args, **cb_kwargs)
 
         # we always store cb_kwargs dict values as arrays to factor in non-unique values
-        if retval_key and retval_key in cb_retvals:
-            cb_retvals[retval_key].append(retval)
-        elif retval_key:
-            cb_retvals[retval_key] = [retval]
-
-    # if cb_retvals key only contains one item this means it is a unique (non-repeated) retval key
-    # so we only return the first element however if it is a 'files' kwarg we always return as a list
-    cb_retvals = {
-        key: value[0] if len(value) == 1 and key != RESERVED_RETVAL_KEY__FILES else value
-        for key, value in cb_retvals.items()
-    }
+        if retval_key:
+            cb_retvals.setdefault(retval_key, []).append(retval)
 
     fn = function.get_deserialized()
 
     new_args = [arg.get_deserialized() for arg in args]
 
+    # Inject return values into kwargs. If a cb_retvals key only contains one item this
+    # means it is a unique (non-repeated) retval key so we only pass the first element,
+    # however if it is a 'files' kwarg we always pass it as a list.
     new_kwargs = {k: v.get_deserialized() for k, v in kwargs.items()}
-
-    # Inject return values into kwargs
-    for key, val in cb_retvals.items():
-        new_kwargs[key] = val
+    new_kwargs.update(
+        (key, value[0] if len(value) == 1 and key != RESERVED_RETVAL_KEY__FILES else value)
+        for key, value in cb_retvals.items()
+    )
 
     output = fn(*new_args, **new_kwargs)
 
     for tup in call_after:
         serialized_fn, serialized_args, serialized_kwargs, retval_key = tup
-        ca_fn = serialized_fn.get_deserialized()
-        ca_args = serialized_args.get_deserialized()
-        ca_kwargs = serialized_kwargs.get_deserialized()
+        ca_fn = _deserialize_dep(serialized_fn)
+        ca_args = _deserialize_dep(serialized_args)
+        ca_kwargs = _deserialize_dep(serialized_kwargs)
         ca_fn(*ca_args, **ca_kwargs)
 
     return TransportableObject(output)
@@ -158,7 +187,7 @@ class _AbstractBaseExecutor(ABC):
         return active_dispatch_info_manager.claim(dispatch_info)
 
     def short_name(self):
-        return self.__module__.split("/")[-1].split(".")[-1]
+        return self.__module__.rpartition("/")[2].rpartition(".")[2]
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary representation of self"""
@@ -180,7 +209,7 @@ class _AbstractBaseExecutor(ABC):
         Instance attributes will be overwritten.
         """
         if object_dict:
-            self.__dict__ = copy.deepcopy(object_dict["attributes"])
+            self.__dict__ = _copy_attributes(object_dict["attributes"])
         return self
 
     @property
@@ -323,9 +352,9 @@ class BaseExecutor(_AbstractBaseExecutor):
                 filename = Path(filepath)
                 filename = filename.expanduser()
                 filename.parent.mkdir(parents=True, exist_ok=True)
-                filename.touch(exist_ok=True)
 
-                with open(filepath, "a") as f:
+                # Appending creates the file if needed
+                with open(filename, "a") as f:
                     f.write(remove_qelectron_db(ss))
 
     async def _execute(
@@ -606,9 +635,9 @@ class AsyncBaseExecutor(_AbstractBaseExecutor):
                 filename = Path(filepath)
                 filename = filename.expanduser()
                 filename.parent.mkdir(parents=True, exist_ok=True)
-                filename.touch(exist_ok=True)
 
-                async with aiofiles.open(filepath, "a") as f:
+                # Appending creates the file if needed
+                async with aiofiles.open(filename, "a") as f:
                     await f.write(remove_qelectron_db(ss))
 
     async def _execute(
@@ -15,8 +15,10 @@
 # limitations under the License.
 
 """Wrappers for the existing Pennylane-Qiskit interface"""
+import threading
 import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import contextmanager
 from math import sqrt
 from typing import Any, List, Sequence, Tuple, Union
@@ -28,6 +30,14 @@ from pennylane_qiskit.qiskit_device import QiskitDevice
 from qiskit.compiler import transpile
 from sessions import init_runtime_service
 
+# Maximum number of compiled circuits kept for reuse
+COMPILED_CIRCUITS_CACHE_SIZE = 128
+
+# Compiled Qiskit circuits in least-recently-used order, keyed by
+# circuit hash and compilation settings
+_compiled_circuits = OrderedDict()
+_compiled_circuits_lock = threading.Lock()
+
 
 class _PennylaneQiskitDevice(QiskitDevice, ABC):
     # pylint: disable=too-many-instance-attributes
@@ -181,11 +191,44 @@ class QiskitSamplerDevice(_PennylaneQiskitDevice):
         for circuit in circuits:
             # Unwraps a quantum script with tensor-like parameters to numpy arrays.
             with circuit.unwrap():
-                qiskit_circuit = super().compile_circuits([circuit]).pop()
+                # The hash covers operations, parameters, and measurements
+                key = (circuit.hash, self._compile_settings_key())
+                with _compiled_circuits_lock:
+                    qiskit_circuit = _compiled_circuits.get(key)
+                    if qiskit_circuit is not None:
+                        _compiled_circuits.move_to_end(key)
+
+                if qiskit_circuit is None:
+                    qiskit_circuit = super().compile_circuits([circuit]).pop()
+                    with _compiled_circuits_lock:
+                        _compiled_circuits[key] = qiskit_circuit.copy()
+                        if len(_compiled_circuits) > COMPILED_CIRCUITS_CACHE_SIZE:
+                            _compiled_circuits.popitem(last=False)
+                else:
+                    # Keep the device state that the parent method would have set,
+                    # skipping only the transpilation
+                    self.reset()
+                    self.create_circuit_object(
+                        circuit.operations, rotations=circuit.diagonalizing_gates
+                    )
+                    # Each caller gets its own copy of the shared cached circuit
+                    qiskit_circuit = qiskit_circuit.copy()
+
+                qiskit_circuit.name = f"circ{len(compiled_circuits)}"
                 compiled_circuits.append(qiskit_circuit)
 
         return compiled_circuits
 
+    def _compile_settings_key(self) -> tuple:
+        """
+        Summarize the settings that affect how circuits are compiled.
+        """
+        return (
+            tuple(self.wires),
+            self.backend_name if self.local_transpile else None,
+            repr(sorted(self.transpile_args.items())),
+        )
+
     def compile(self):
         """
         Overrides `QiskitDevice.compile` with custom choice logic for the `backend`
@@ -258,10 +301,13 @@ class QiskitSamplerDevice(_PennylaneQiskitDevice):
         bit_strings = list(dist_bin)
         probs = [dist_bin[bs] for bs in bit_strings]
 
+        # convert each distinct bit string once, rather than once per sample
+        bit_arrays = np.array([[int(i) for i in bs[::-1]] for bs in bit_strings])
+
         # generate artificial samples from quasi-distribution probabilities
         size = self.shots if self.shots else self._default_shots
-        bit_samples = np.random.choice(bit_strings, size=size, p=probs)
-        return np.vstack([np.array([int(i) for i in s[::-1]]) for s in bit_samples])
+        sample_indices = np.random.choice(len(bit_strings), size=size, p=probs)
+        return bit_arrays[sample_indices]
 
     @contextmanager
     def set_distribution(self, quasi_dist):
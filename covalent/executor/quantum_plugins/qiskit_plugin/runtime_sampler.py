@@ -81,18 +81,19 @@ class QiskitRuntimeSampler(QiskitSamplerDevice):
         compiled_circuits = self.compile_circuits(circuits)
         self._active_circuits = [circuit.copy() for circuit in circuits]
 
-        # Submit circuit objects to Qiskit Runtime
+        # Submit circuit objects to Qiskit Runtime. The session is kept
+        # open so that later executions can reuse it.
         max_time = timeout or self.max_time
-        with get_cached_session(self.service, self.backend, max_time) as session:
-            sampler = Sampler(session=session, options=self.options)
+        session = get_cached_session(self.service, self.backend, max_time)
+        sampler = Sampler(session=session, options=self.options)
 
-            if self.single_job:
-                job = sampler.run(compiled_circuits)
+        if self.single_job:
+            job = sampler.run(compiled_circuits)
+            self._active_jobs.append(job)
+        else:
+            for compiled_circuit in compiled_circuits:
+                job = sampler.run(compiled_circuit)
                 self._active_jobs.append(job)
-            else:
-                for compiled_circuit in compiled_circuits:
-                    job = sampler.run(compiled_circuit)
-                    self._active_jobs.append(job)
 
         # This flag distinguishes vector inputs from gradient computations
         self._vector_input = self._n_original_circuits != self._n_circuits
@@ -17,12 +17,17 @@
 """
 Defines interactions with Qiskit Runtime sessions and services.
 """
+import atexit
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Dict, Union
 
 from qiskit_ibm_runtime import QiskitRuntimeService, Session
 
+from covalent._shared_files import logger
+
+app_log = logger.app_log
+
 
 @lru_cache
 def init_runtime_service(
@@ -95,6 +100,19 @@ def get_cached_session(service, backend, max_time) -> Session:
     return _sessions[session_id]
 
 
+@atexit.register
+def close_cached_sessions() -> None:
+    """
+    Close all cached sessions, e.g. on interpreter exit.
+    """
+    while _sessions:
+        session_id, session = _sessions.popitem()
+        try:
+            session.close()
+        except Exception as ex:  # pylint: disable=broad-except
+            app_log.warning("Failed to close Qiskit Runtime session for %s: %s", session_id, ex)
+
+
 def make_session_id(service, backend, max_time) -> SessionIdentifier:
     """
     Create session identifier from `Session` initialization arguments
@@ -14,12 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ..._shared_files.utils import cloudpickle_deserialize, cloudpickle_serialize
 from ..qserver import LocalQServer
 from .base_client import BaseQClient
 
 # Since in the local case, the server and client are the same
-# thus the "server" class's functions are directly accessed
+# thus the "server" class's functions are directly accessed,
+# and objects are passed through without serialization
 
 
 class LocalQClient(BaseQClient):
@@ -53,7 +53,7 @@ class LocalQClient(BaseQClient):
         return self.deserialize(ser_results)
 
     def serialize(self, obj):
-        return cloudpickle_serialize(obj)
+        return obj
 
     def deserialize(self, ser_obj):
-        return cloudpickle_deserialize(ser_obj)
+        return ser_obj
@@ -15,7 +15,9 @@
 # limitations under the License.
 
 import base64
-from typing import Callable, Union
+from typing import Callable, Optional, Union
+
+from pydantic import PrivateAttr
 
 from ..._shared_files.utils import cloudpickle_deserialize, cloudpickle_serialize
 from .base import AsyncBaseQCluster, BaseQExecutor
@@ -47,15 +49,18 @@ class QCluster(AsyncBaseQCluster):
     # This needs to be without the "_" prefix so that it gets propagated to the server.
     selector_serialized: bool = False
 
-    def batch_submit(self, qscripts_list):
-        if self.selector_serialized:
-            self.selector = self.deserialize_selector()
+    # The selector in callable form. Caching it here leaves `self.selector` as is.
+    _selector_cached: Optional[Callable] = PrivateAttr(default=None)
+
+    # The pickled selector, kept by the serializing process to skip base64 decoding.
+    _selector_pickle: Optional[bytes] = PrivateAttr(default=None)
 
+    def batch_submit(self, qscripts_list):
         selector = self.get_selector()
         selected_executor: BaseQExecutor = selector(qscripts_list, self.executors)
 
-        # Copy server-side set attributes into selector executor.
-        selected_executor.qelectron_info = self.qelectron_info.copy()
+        # Share server-side set attributes with the selected executor.
+        selected_executor.qelectron_info = self.qelectron_info
         return selected_executor.batch_submit(qscripts_list)
 
     def serialize_selector(self) -> None:
@@ -63,21 +68,21 @@ class QCluster(AsyncBaseQCluster):
             return
 
         # serialize to bytes with cloudpickle
-        self.selector = cloudpickle_serialize(self.selector)
+        selector_pickle = cloudpickle_serialize(self.selector)
 
         # convert to string to make JSON-able
-        self.selector = base64.b64encode(self.selector).decode("utf-8")
+        self.selector = base64.b64encode(selector_pickle).decode("utf-8")
         self.selector_serialized = True
+        self._selector_pickle = selector_pickle
+        self._selector_cached = None
 
     def deserialize_selector(self) -> Union[str, Callable]:
         if not self.selector_serialized:
             return self.selector
 
         # Deserialize the selector function (or string).
-        selector = cloudpickle_deserialize(base64.b64decode(self.selector.encode("utf-8")))
-
-        self.selector_serialized = False
-        return selector
+        selector_pickle = self._selector_pickle or base64.b64decode(self.selector)
+        return cloudpickle_deserialize(selector_pickle)
 
     def dict(self, *args, **kwargs) -> dict:
         # override `dict` method to convert dict attributes to JSON strings
@@ -89,13 +94,17 @@ class QCluster(AsyncBaseQCluster):
         """
         Wraps `self.selector` to return defaults corresponding to string values.
 
-        This method is called inside `batch_submit`.
+        This method is called inside `batch_submit`. The selector is only
+        deserialized on the first call.
         """
-        self.selector = self.deserialize_selector()
+        if self._selector_cached is None:
+            selector = self.deserialize_selector()
+
+            if isinstance(selector, str):
+                # use default selector
+                selector_cls = selector_map[selector]
+                selector = selector_cls()
 
-        if isinstance(self.selector, str):
-            # use default selector
-            selector_cls = selector_map[self.selector]
-            self.selector = selector_cls()
+            self._selector_cached = selector
 
-        return self.selector
+        return self._selector_cached
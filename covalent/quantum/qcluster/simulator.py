@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import replace
 from typing import Union
 
 from pydantic import validator
@@ -88,8 +89,8 @@ class Simulator(BaseQExecutor):
 
         # Pass on server-set settings from original device.
         updates = {"device_name": device, "device_shots": self.override_shots}
-        self._backend.qelectron_info = self.qelectron_info.copy(update=updates)
-        self._backend.qnode_specs = self.qnode_specs.copy()
+        self._backend.qelectron_info = replace(self.qelectron_info, **updates)
+        self._backend.qnode_specs = replace(self.qnode_specs)
 
         return self._backend.batch_submit(qscripts_list)
 
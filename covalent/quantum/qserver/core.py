@@ -124,7 +124,7 @@ class QServer:
                 selected_executor = get_cached_executor(**selected_executor.dict())
 
             # This is the only place where the qnode_specs are set.
-            selected_executor.qnode_specs = qnode_specs.copy()
+            selected_executor.qnode_specs = qnode_specs
 
             # An example `linked_executors` will look like:
             # [exec_4, exec_4, exec_2, exec_3]
@@ -182,7 +182,7 @@ class QServer:
         # Generating futures from each executor:
         executor_future_pairs = []
         for executor, qscript_sub_batch in executor_qscript_sub_batch_pairs:
-            executor.qelectron_info = qelectron_info.copy()
+            executor.qelectron_info = qelectron_info
             qscript_futures = executor.batch_submit(qscript_sub_batch.values())
 
             futures_dict = dict(zip(qscript_sub_batch.keys(), qscript_futures))
@@ -20,11 +20,10 @@ Defines the core functionality of the dispatcher
 
 import asyncio
 import traceback
+from collections import deque
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 
-import networkx as nx
-
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.defaults import WAIT_EDGE_NAME, parameter_prefix
@@ -34,41 +33,55 @@ from . import data_manager as datasvc
 from . import runner
 from .data_modules import graph as tg_utils
 from .data_modules import job_manager as jbmgr
-from .dispatcher_modules.caches import _pending_parents, _sorted_task_groups, _unresolved_tasks
+from .dispatcher_modules.caches import (
+    _abstract_task_inputs,
+    _pending_parents,
+    _sorted_task_groups,
+    _unresolved_tasks,
+)
 from .runner_modules.cancel import cancel_tasks
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
-_global_status_queue = None
-_status_queues = {}
+# Node status messages are appended to a deque and the listener is
+# woken up through a single event, avoiding per-message Queue overhead
+_global_status_queue: deque = None
+_global_status_event: asyncio.Event = None
 _futures = {}
 
 _global_event_listener = None
 
+# Keep references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks = set()
+
 SYNC_DISPATCHES = get_config("dispatcher.use_async_dispatcher") == "false"
 
+# Bound on the number of dispatches (including sublattices) being
+# started concurrently; created lazily inside the running event loop
+MAX_CONCURRENT_DISPATCH_STARTUPS = int(get_config("dispatcher.max_concurrent_dispatch_startups"))
+_dispatch_startup_semaphore = None
+
+
+def _get_dispatch_startup_semaphore() -> asyncio.Semaphore:
+    global _dispatch_startup_semaphore
+    if _dispatch_startup_semaphore is None:
+        _dispatch_startup_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DISPATCH_STARTUPS)
+    return _dispatch_startup_semaphore
+
 
 # Domain: dispatcher
-async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: str) -> dict:
-    """Return placeholders for the required inputs for a task execution.
+def _abstract_inputs_from_edges(edges: List[Tuple[int, Dict]]) -> dict:
+    """Arrange a node's incoming edges into args and kwargs placeholders.
 
     Args:
-        dispatch_id: id of the current dispatch
-        node_id: Node id of this task in the transport graph.
-        node_name: Name of the node.
+        edges: List of (parent node id, edge attributes) pairs.
 
-    Returns: inputs: Input dictionary to be passed to the task with
-        `node_id` placeholders for args, kwargs. These are to be
-        resolved to their values later.
+    Returns: Input dictionary with `node_id` placeholders for args, kwargs.
     """
 
     abstract_task_input = {"args": [], "kwargs": {}}
 
-    for edge in await tg_utils.get_incoming_edges(dispatch_id, node_id):
-        parent = edge["source"]
-
-        d = edge["attrs"]
-
+    for parent, d in edges:
         if d["edge_name"] != WAIT_EDGE_NAME:
             if d["param_type"] == "arg":
                 abstract_task_input["args"].append((parent, d["arg_index"]))
@@ -82,10 +95,32 @@ async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: s
     return abstract_task_input
 
 
+# Domain: dispatcher
+async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: str) -> dict:
+    """Return placeholders for the required inputs for a task execution.
+
+    Args:
+        dispatch_id: id of the current dispatch
+        node_id: Node id of this task in the transport graph.
+        node_name: Name of the node.
+
+    Returns: inputs: Input dictionary to be passed to the task with
+        `node_id` placeholders for args, kwargs. These are to be
+        resolved to their values later.
+    """
+
+    # Use the layout computed when the dispatch was started if available
+    if await _abstract_task_inputs.belongs(dispatch_id, node_id):
+        return await _abstract_task_inputs.get_inputs(dispatch_id, node_id)
+
+    edges = await tg_utils.get_incoming_edges(dispatch_id, node_id)
+    return _abstract_inputs_from_edges([(edge["source"], edge["attrs"]) for edge in edges])
+
+
 # Domain: dispatcher
 async def _handle_completed_node(dispatch_id: str, node_id: int):
     next_task_groups = []
-    app_log.debug(f"Node {node_id} completed")
+    app_log.debug("Node %s completed", node_id)
 
     parent_gid = (await datasvc.electron.get(dispatch_id, node_id, ["task_group_id"]))[
         "task_group_id"
@@ -93,11 +128,11 @@ async def _handle_completed_node(dispatch_id: str, node_id: int):
     for child in await tg_utils.get_node_successors(dispatch_id, node_id):
         node_id = child["node_id"]
         gid = child["task_group_id"]
-        app_log.debug(f"dispatch {dispatch_id}: parent gid {parent_gid}, child gid {gid}")
+        app_log.debug("dispatch %s: parent gid %s, child gid %s", dispatch_id, parent_gid, gid)
         if parent_gid != gid:
             now_pending = await _pending_parents.decrement(dispatch_id, gid)
             if now_pending < 1:
-                app_log.debug(f"Queuing task group {gid} for execution")
+                app_log.debug("Queuing task group %s for execution", gid)
                 next_task_groups.append(gid)
 
     return next_task_groups
@@ -105,64 +140,88 @@ async def _handle_completed_node(dispatch_id: str, node_id: int):
 
 # Domain: dispatcher
 async def _handle_failed_node(dispatch_id: str, node_id: int):
-    app_log.debug(f"Node {dispatch_id}:{node_id} failed")
+    app_log.debug("Node %s:%s failed", dispatch_id, node_id)
     app_log.debug("8A: Failed node upsert statement (run_planned_workflow)")
 
 
 # Domain: dispatcher
 async def _handle_cancelled_node(dispatch_id: str, node_id: int):
-    app_log.debug(f"Node {dispatch_id}:{node_id} cancelled")
+    app_log.debug("Node %s:%s cancelled", dispatch_id, node_id)
     app_log.debug("9: Cancelled node upsert statement (run_planned_workflow)")
 
 
 # Domain: dispatcher
-async def _get_initial_tasks_and_deps(dispatch_id: str) -> Tuple[int, int, Dict]:
+async def _get_initial_tasks_and_deps(dispatch_id: str) -> Tuple[List, Dict, Dict, Dict]:
     """Compute the initial batch of tasks to submit and initialize each task's dep count
 
-    Returns: (num_tasks, ready_nodes, pending_parents) where num_tasks is
-        the total number of tasks in the graph, ready_nodes is the
-        initial list of tasks to dispatch, and pending_parents is a map
-        from `node_id` to the number of parents that have yet to
-        complete.
+    Returns: (initial_task_groups, pending_parents, sorted_task_groups,
+        abstract_inputs) where initial_task_groups is the initial list
+        of task groups to dispatch, pending_parents is a map from
+        `task_group_id` to the number of parents that have yet to
+        complete, sorted_task_groups maps each `task_group_id` to its
+        topologically sorted nodes, and abstract_inputs maps each
+        `node_id` to its abstract task inputs.
 
     """
 
-    # Number of pending predecessor nodes for each task group
-    pending_parents = {}
-
     g_node_link = await tg_utils.get_nodes_links(dispatch_id)
-    g = nx.readwrite.node_link_graph(g_node_link)
 
-    # Topologically sort each task group
+    # Work directly on the node-link data instead of rebuilding an NX graph
+    task_group_ids = {node["id"]: node["task_group_id"] for node in g_node_link["nodes"]}
+    indegree = {node_id: 0 for node_id in task_group_ids}
+    successors = {node_id: [] for node_id in task_group_ids}
+    incoming_edges = {node_id: [] for node_id in task_group_ids}
+    for link in g_node_link["links"]:
+        indegree[link["target"]] += 1
+        successors[link["source"]].append(link["target"])
+        incoming_edges[link["target"]].append((link["source"], link))
+
+    # Topologically sort each task group (Kahn's algorithm)
     sorted_task_groups = {}
-    for node_id in nx.topological_sort(g):
-        gid = g.nodes[node_id]["task_group_id"]
-        if gid not in sorted_task_groups:
-            sorted_task_groups[gid] = [node_id]
-            pending_parents[gid] = 0
-        else:
-            sorted_task_groups[gid].append(node_id)
-
-    for node_id in g.nodes:
-        parent_gid = g.nodes[node_id]["task_group_id"]
-        for succ, datadict in g.adj[node_id].items():
-            child_gid = g.nodes[succ]["task_group_id"]
-
-            if parent_gid != child_gid:
-                n_edges = len(datadict.keys())
-                pending_parents[child_gid] += n_edges
+    # Number of pending predecessor nodes for each task group
+    pending_parents = {}
+    generation = [node_id for node_id, d in indegree.items() if d == 0]
+    while generation:
+        next_generation = []
+        for node_id in generation:
+            gid = task_group_ids[node_id]
+            if gid not in sorted_task_groups:
+                sorted_task_groups[gid] = [node_id]
+                pending_parents[gid] = 0
+            else:
+                sorted_task_groups[gid].append(node_id)
+
+            for succ in successors[node_id]:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    next_generation.append(succ)
+        generation = next_generation
+
+    for link in g_node_link["links"]:
+        parent_gid = task_group_ids[link["source"]]
+        child_gid = task_group_ids[link["target"]]
+        if parent_gid != child_gid:
+            pending_parents[child_gid] += 1
+
+    abstract_inputs = {
+        node_id: _abstract_inputs_from_edges(edges) for node_id, edges in incoming_edges.items()
+    }
 
     initial_task_groups = [gid for gid, d in pending_parents.items() if d == 0]
-    app_log.debug(f"Sorted task groups: {sorted_task_groups}")
-    return initial_task_groups, pending_parents, sorted_task_groups
+    app_log.debug("Sorted task groups: %s", sorted_task_groups)
+    return initial_task_groups, pending_parents, sorted_task_groups, abstract_inputs
 
 
 # Domain: dispatcher
 async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_group_id: int):
-    # Handle parameter nodes
+    # Fetch all the attributes needed to submit the group in one query
+    node_attrs = await datasvc.electron.get_bulk(
+        dispatch_id, sorted_nodes, ["name", "status", "executor", "executor_data"]
+    )
+
     # Get name of the node for the current task
-    node_name = (await datasvc.electron.get(dispatch_id, sorted_nodes[0], ["name"]))["name"]
-    app_log.debug(f"7A: Node name: {node_name} (run_planned_workflow).")
+    node_name = node_attrs[0]["name"]
+    app_log.debug("7A: Node name: %s (run_planned_workflow).", node_name)
 
     # Handle parameter nodes
     if node_name.startswith(parameter_prefix):
@@ -187,25 +246,19 @@ async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_gro
 
         # Skip the group if all task outputs can be reused from a
         # previous dispatch (for redispatch).
-        statuses = await datasvc.electron.get_bulk(dispatch_id, sorted_nodes, ["status"])
         incomplete = list(
-            filter(lambda record: record["status"] != RESULT_STATUS.PENDING_REUSE, statuses)
+            filter(lambda record: record["status"] != RESULT_STATUS.PENDING_REUSE, node_attrs)
         )
 
         if incomplete:
             # Gather inputs for each task and send the task spec sequence to the runner
             task_specs = []
 
-            for node_id in sorted_nodes:
-                app_log.debug(f"Gathering inputs for task {node_id} (run_planned_workflow).")
+            for node_id, executor_attrs in zip(sorted_nodes, node_attrs):
+                app_log.debug("Gathering inputs for task %s (run_planned_workflow).", node_id)
 
                 abs_task_input = await _get_abstract_task_inputs(dispatch_id, node_id, node_name)
 
-                executor_attrs = await datasvc.electron.get(
-                    dispatch_id,
-                    node_id,
-                    ["executor", "executor_data"],
-                )
                 selected_executor = executor_attrs["executor"]
                 selected_executor_data = executor_attrs["executor_data"]
                 task_spec = {
@@ -219,9 +272,12 @@ async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_gro
                 task_specs.append(task_spec)
 
             app_log.debug(
-                f"Submitting task group {dispatch_id}:{task_group_id} ({len(sorted_nodes)} tasks) to runner"
+                "Submitting task group %s:%s (%d tasks) to runner",
+                dispatch_id,
+                task_group_id,
+                len(sorted_nodes),
             )
-            app_log.debug(f"Using new runner for task group {task_group_id}")
+            app_log.debug("Using new runner for task group %s", task_group_id)
 
             known_nodes = list(set(known_nodes))
 
@@ -240,11 +296,13 @@ async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_gro
                 selected_executor=[selected_executor, selected_executor_data],
             )
 
-            asyncio.create_task(coro)
+            fut = asyncio.create_task(coro)
+            _background_tasks.add(fut)
+            fut.add_done_callback(_background_tasks.discard)
         else:
             ts = datetime.now(timezone.utc)
             for node_id in sorted_nodes:
-                app_log.debug(f"Skipping already completed node {dispatch_id}:{node_id}")
+                app_log.debug("Skipping already completed node %s:%s", dispatch_id, node_id)
                 node_result = {
                     "node_id": node_id,
                     "start_time": ts,
@@ -304,7 +362,10 @@ async def run_workflow(dispatch_id: str, wait: bool = SYNC_DISPATCHES) -> RESULT
             fut = asyncio.Future()
             _futures[dispatch_id] = fut
 
-        dispatch_status = await _submit_initial_tasks(dispatch_id)
+        # Only the startup is throttled; waiting for completion must not
+        # hold the semaphore or nested sublattices could deadlock
+        async with _get_dispatch_startup_semaphore():
+            dispatch_status = await _submit_initial_tasks(dispatch_id)
 
         if wait:
             app_log.debug(f"Waiting for dispatch {dispatch_id}")
@@ -376,7 +437,8 @@ async def notify_node_status(
         "detail": detail,
     }
 
-    await _global_status_queue.put(msg)
+    _global_status_queue.append(msg)
+    _global_status_event.set()
 
 
 async def _finalize_dispatch(dispatch_id: str):
@@ -388,9 +450,7 @@ async def _finalize_dispatch(dispatch_id: str):
     cancelled = incomplete_tasks["cancelled"]
     if failed or cancelled:
         app_log.debug(f"Workflow {dispatch_id} cancelled or failed")
-        failed_nodes = failed
-        failed_nodes = map(lambda x: f"{x[0]}: {x[1]}", failed_nodes)
-        failed_nodes_msg = "\n".join(failed_nodes)
+        failed_nodes_msg = "\n".join(f"{node_id}: {name}" for node_id, name in failed)
         error_msg = "The following tasks failed:\n" + failed_nodes_msg
         ts = datetime.now(timezone.utc)
         status = RESULT_STATUS.FAILED if failed else RESULT_STATUS.CANCELLED
@@ -402,21 +462,31 @@ async def _finalize_dispatch(dispatch_id: str):
         )
         await datasvc.dispatch.update(dispatch_id, result_update)
 
+        # The final status was just written so there's no need to read it back
+        return status
+
     app_log.debug("8: All tasks finished running (run_planned_workflow)")
 
     app_log.debug("Workflow already postprocessed")
 
+    # The postprocessing electron sets the final status otherwise
     result_info = await datasvc.dispatch.get(dispatch_id, ["status"])
     return result_info["status"]
 
 
-async def _initialize_caches(dispatch_id, pending_parents, sorted_task_groups):
+async def _initialize_caches(
+    dispatch_id, pending_parents, sorted_task_groups, abstract_inputs=None
+):
     for gid, indegree in pending_parents.items():
         await _pending_parents.set_pending(dispatch_id, gid, indegree)
 
     for gid, sorted_nodes in sorted_task_groups.items():
         await _sorted_task_groups.set_task_group(dispatch_id, gid, sorted_nodes)
 
+    if abstract_inputs:
+        for node_id, inputs in abstract_inputs.items():
+            await _abstract_task_inputs.set_inputs(dispatch_id, node_id, inputs)
+
     await _unresolved_tasks.set_unresolved(dispatch_id, 0)
 
 
@@ -430,26 +500,30 @@ async def _submit_initial_tasks(dispatch_id: str):
     app_log.debug(f"4: Workflow status changed to running {dispatch_id} (run_planned_workflow).")
     app_log.debug("5: Wrote lattice status to DB (run_planned_workflow).")
 
-    initial_groups, pending_parents, sorted_task_groups = await _get_initial_tasks_and_deps(
-        dispatch_id
-    )
+    (
+        initial_groups,
+        pending_parents,
+        sorted_task_groups,
+        abstract_inputs,
+    ) = await _get_initial_tasks_and_deps(dispatch_id)
 
-    await _initialize_caches(dispatch_id, pending_parents, sorted_task_groups)
+    await _initialize_caches(dispatch_id, pending_parents, sorted_task_groups, abstract_inputs)
 
     for gid in initial_groups:
         sorted_nodes = sorted_task_groups[gid]
-        app_log.debug(f"Sorted nodes group group {gid}: {sorted_nodes}")
+        app_log.debug("Sorted nodes group group %s: %s", gid, sorted_nodes)
         await _unresolved_tasks.increment(dispatch_id, len(sorted_nodes))
 
-    for gid in initial_groups:
-        sorted_nodes = sorted_task_groups[gid]
-        await _submit_task_group(dispatch_id, sorted_nodes, gid)
+    # Submit the initial wave of independent task groups concurrently
+    await asyncio.gather(
+        *[_submit_task_group(dispatch_id, sorted_task_groups[gid], gid) for gid in initial_groups]
+    )
 
     return RESULT_STATUS.RUNNING
 
 
 async def _handle_node_status_update(dispatch_id, node_id, node_status, detail):
-    app_log.debug(f"Received node status update {node_id}: {node_status}")
+    app_log.debug("Received node status update %s: %s", node_id, node_status)
 
     if node_status == RESULT_STATUS.RUNNING:
         return
@@ -465,10 +539,12 @@ async def _handle_node_status_update(dispatch_id, node_id, node_status, detail):
 
     if node_status == RESULT_STATUS.COMPLETED:
         next_task_groups = await _handle_completed_node(dispatch_id, node_id)
+        coros = []
         for gid in next_task_groups:
             sorted_nodes = await _sorted_task_groups.get_task_group(dispatch_id, gid)
             await _unresolved_tasks.increment(dispatch_id, len(sorted_nodes))
-            await _submit_task_group(dispatch_id, sorted_nodes, gid)
+            coros.append(_submit_task_group(dispatch_id, sorted_nodes, gid))
+        await asyncio.gather(*coros)
 
     if node_status == RESULT_STATUS.FAILED:
         await _handle_failed_node(dispatch_id, node_id)
@@ -505,9 +581,15 @@ async def _handle_dispatch_exception(dispatch_id: str, ex: Exception) -> RESULT_
 async def _node_event_listener():
     app_log.debug("Starting event listener")
     while True:
-        msg = await _global_status_queue.get()
+        await _global_status_event.wait()
+        _global_status_event.clear()
 
-        asyncio.create_task(_handle_event(msg))
+        # Drain the whole backlog of status updates in one wakeup
+        while _global_status_queue:
+            msg = _global_status_queue.popleft()
+            fut = asyncio.create_task(_handle_event(msg))
+            _background_tasks.add(fut)
+            fut.add_done_callback(_background_tasks.discard)
 
 
 async def _handle_event(msg: Dict):
@@ -549,11 +631,14 @@ async def _clear_caches(dispatch_id: str):
     await _unresolved_tasks.remove(dispatch_id)
 
     g_node_link = await tg_utils.get_nodes_links(dispatch_id)
-    g = nx.readwrite.node_link_graph(g_node_link)
 
-    task_groups = {g.nodes[i]["task_group_id"] for i in g.nodes}
+    task_groups = {node["task_group_id"] for node in g_node_link["nodes"]}
 
     for gid in task_groups:
         # Clean up no longer referenced keys
         await _pending_parents.remove(dispatch_id, gid)
         await _sorted_task_groups.remove(dispatch_id, gid)
+
+    for node in g_node_link["nodes"]:
+        if await _abstract_task_inputs.belongs(dispatch_id, node["id"]):
+            await _abstract_task_inputs.remove(dispatch_id, node["id"])
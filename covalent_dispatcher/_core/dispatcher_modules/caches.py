@@ -33,6 +33,10 @@ def _task_groups_key(dispatch_id: str, task_group_id: int):
     return f"task-groups-{dispatch_id}:{task_group_id}"
 
 
+def _abstract_inputs_key(dispatch_id: str, node_id: int):
+    return f"abstract-inputs-{dispatch_id}:{node_id}"
+
+
 class _UnresolvedTasksCache:
     def __init__(self, store: _KeyValueBase = _DictStore()):
         self._store = store
@@ -96,6 +100,28 @@ class _SortedTaskGroups:
         await self._store.remove(key)
 
 
+class _AbstractTaskInputsCache:
+    def __init__(self, store: _KeyValueBase = _DictStore()):
+        self._store = store
+
+    async def get_inputs(self, dispatch_id: str, node_id: int):
+        key = _abstract_inputs_key(dispatch_id, node_id)
+        return await self._store.get(key)
+
+    async def set_inputs(self, dispatch_id: str, node_id: int, abstract_inputs: dict):
+        key = _abstract_inputs_key(dispatch_id, node_id)
+        await self._store.insert(key, abstract_inputs)
+
+    async def belongs(self, dispatch_id: str, node_id: int):
+        key = _abstract_inputs_key(dispatch_id, node_id)
+        return await self._store.belongs(key)
+
+    async def remove(self, dispatch_id: str, node_id: int):
+        key = _abstract_inputs_key(dispatch_id, node_id)
+        await self._store.remove(key)
+
+
 _pending_parents = _PendingParentsCache()
 _unresolved_tasks = _UnresolvedTasksCache()
 _sorted_task_groups = _SortedTaskGroups()
+_abstract_task_inputs = _AbstractTaskInputsCache()
@@ -20,9 +20,10 @@ Defines the core functionality of the runner
 
 import asyncio
 import importlib
+import json
 import traceback
 from datetime import datetime, timezone
-from functools import partial
+from functools import lru_cache, partial
 from typing import Any, Dict, List, Tuple
 
 from covalent._shared_files import logger
@@ -257,12 +258,24 @@ async def _gather_deps(dispatch_id: str, node_id: int) -> Tuple[List, List]:
         dispatch_id, node_id, ["deps", "call_before", "call_after"]
     )
 
-    deps = deps_attrs["deps"]
+    # Nodes frequently share the same deps, so key the assembled
+    # deps by their JSON representation
+    call_before, call_after = _assemble_deps(
+        json.dumps(deps_attrs["deps"], sort_keys=True),
+        json.dumps(deps_attrs["call_before"], sort_keys=True),
+        json.dumps(deps_attrs["call_after"], sort_keys=True),
+    )
+
+    return list(call_before), list(call_after)
+
 
-    # Assemble call_before and call_after from all the deps
+@lru_cache(maxsize=256)
+def _assemble_deps(
+    deps_json: str, call_before_objs_json: str, call_after_objs_json: str
+) -> Tuple[Tuple, Tuple]:
+    """Rehydrate deps from JSON into call_before and call_after"""
 
-    call_before_objs_json = deps_attrs["call_before"]
-    call_after_objs_json = deps_attrs["call_after"]
+    deps = json.loads(deps_json)
 
     call_before = []
     call_after = []
@@ -278,17 +291,17 @@ async def _gather_deps(dispatch_id: str, node_id: int) -> Tuple[List, List]:
         dep.from_dict(deps["pip"])
         call_before.append(dep.apply())
 
-    for dep_json in call_before_objs_json:
+    for dep_json in json.loads(call_before_objs_json):
         dep = DepsCall()
         dep.from_dict(dep_json)
         call_before.append(dep.apply())
 
-    for dep_json in call_after_objs_json:
+    for dep_json in json.loads(call_after_objs_json):
         dep = DepsCall()
         dep.from_dict(dep_json)
         call_after.append(dep.apply())
 
-    return call_before, call_after
+    return tuple(call_before), tuple(call_after)
 
 
 # Domain: runner
@@ -185,6 +185,25 @@ class DispatchedObject(Generic[MetaType, AssetLinkType]):
             with self.session() as session:
                 self._set_value(key, val, session)
 
+    def _set_values(self, values: Dict[str, Any], session: Session) -> None:
+        meta_values = {}
+        for key, val in values.items():
+            if key in type(self).metadata_keys:
+                meta_values[type(self).meta_record_map(key)] = val
+            else:
+                self.get_asset(key, session).store_data(val)
+
+        # Write all metadata fields in a single UPDATE
+        if meta_values:
+            self.metadata.update(session, values=meta_values)
+
+    def set_values(self, values: Dict[str, Any], session: Session = None) -> None:
+        if session is not None:
+            self._set_values(values, session)
+        else:
+            with self.session() as session:
+                self._set_values(values, session)
+
     def get_values(self, keys: List[str], session: Session = None, refresh: bool = True) -> Dict:
         return {key: self.get_value(key, session, refresh) for key in keys}
 
@@ -83,6 +83,10 @@ class Electron(DispatchedObject[ElectronMeta, ElectronAsset]):
     def set_value(self, key: str, val: Any, session: Session = None) -> None:
         super().set_value(key, set_filters[key](val), session)
 
+    def set_values(self, values: Dict[str, Any], session: Session = None) -> None:
+        filtered = {key: set_filters[key](val) for key, val in values.items()}
+        super().set_values(filtered, session)
+
 
 def resolve_sub_dispatch_id(obj: Electron, session: Session) -> str:
     stmt = select(models.Lattice.dispatch_id).where(models.Lattice.electron_id == obj._electron_id)
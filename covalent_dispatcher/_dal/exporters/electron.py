@@ -18,6 +18,8 @@
 """Functions to transform Electron -> ElectronSchema"""
 
 
+from sqlalchemy.orm import Session
+
 from covalent._shared_files import logger
 from covalent._shared_files.schemas.asset import AssetSchema
 from covalent._shared_files.schemas.electron import (
@@ -31,16 +33,16 @@ app_log = logger.app_log
 
 
 # Electrons are assumed to represent full DB records
-def _export_electron_meta(e: Electron) -> ElectronMetadata:
-    task_group_id = e.get_value("task_group_id", None, refresh=False)
-    name = e.get_value("name", None, refresh=False)
-    executor = e.get_value("executor", None, refresh=False)
-    executor_data = e.get_value("executor_data", None, refresh=False)
-    qelectron_data_exists = e.get_value("qelectron_data_exists", None, refresh=False)
-    sub_dispatch_id = e.get_value("sub_dispatch_id", None, refresh=False)
-    status = e.get_value("status", None, refresh=False)
-    start_time = e.get_value("start_time", None, refresh=False)
-    end_time = e.get_value("end_time", None, refresh=False)
+def _export_electron_meta(e: Electron, session: Session = None) -> ElectronMetadata:
+    task_group_id = e.get_value("task_group_id", session, refresh=False)
+    name = e.get_value("name", session, refresh=False)
+    executor = e.get_value("executor", session, refresh=False)
+    executor_data = e.get_value("executor_data", session, refresh=False)
+    qelectron_data_exists = e.get_value("qelectron_data_exists", session, refresh=False)
+    sub_dispatch_id = e.get_value("sub_dispatch_id", session, refresh=False)
+    status = e.get_value("status", session, refresh=False)
+    start_time = e.get_value("start_time", session, refresh=False)
+    end_time = e.get_value("end_time", session, refresh=False)
 
     return ElectronMetadata(
         task_group_id=task_group_id,
@@ -71,7 +73,7 @@ def _export_electron_assets(e: Electron) -> ElectronAssets:
     return ElectronAssets(**manifests)
 
 
-def export_electron(e: Electron) -> ElectronSchema:
-    metadata = _export_electron_meta(e)
+def export_electron(e: Electron, session: Session = None) -> ElectronSchema:
+    metadata = _export_electron_meta(e, session)
     assets = _export_electron_assets(e)
     return ElectronSchema(id=e.node_id, metadata=metadata, assets=assets)
@@ -18,6 +18,8 @@
 """Functions to transform Lattice -> LatticeSchema"""
 
 
+from sqlalchemy.orm import Session
+
 from covalent._shared_files.schemas.asset import AssetSchema
 from covalent._shared_files.schemas.lattice import LatticeAssets, LatticeMetadata, LatticeSchema
 from covalent_dispatcher._dal.lattice import ASSET_KEYS, METADATA_KEYS, Lattice
@@ -25,8 +27,8 @@ from covalent_dispatcher._dal.lattice import ASSET_KEYS, METADATA_KEYS, Lattice
 from .tg import export_transport_graph
 
 
-def _export_lattice_meta(lat: Lattice) -> LatticeMetadata:
-    metadata_kwargs = {key: lat.get_value(key, None, refresh=False) for key in METADATA_KEYS}
+def _export_lattice_meta(lat: Lattice, session: Session = None) -> LatticeMetadata:
+    metadata_kwargs = {key: lat.get_value(key, session, refresh=False) for key in METADATA_KEYS}
     return LatticeMetadata(**metadata_kwargs)
 
 
@@ -45,8 +47,8 @@ def _export_lattice_assets(lat: Lattice) -> LatticeAssets:
     return LatticeAssets(**manifests)
 
 
-def export_lattice(lat: Lattice) -> LatticeSchema:
-    metadata = _export_lattice_meta(lat)
+def export_lattice(lat: Lattice, session: Session = None) -> LatticeSchema:
+    metadata = _export_lattice_meta(lat, session)
     assets = _export_lattice_assets(lat)
-    transport_graph = export_transport_graph(lat.transport_graph)
+    transport_graph = export_transport_graph(lat.transport_graph, session)
     return LatticeSchema(metadata=metadata, assets=assets, transport_graph=transport_graph)
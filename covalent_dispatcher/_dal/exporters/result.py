@@ -18,6 +18,8 @@
 """Functions to transform Lattice -> LatticeSchema"""
 
 
+from sqlalchemy.orm import Session
+
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.schemas.asset import AssetSchema
@@ -36,6 +38,7 @@ from ..utils.uri_filters import AssetScope, URIFilterPolicy, filter_asset_uri
 from .lattice import export_lattice
 
 METADATA_KEYS_TO_OMIT = {"num_nodes"}
+_EXPORT_METADATA_KEYS = tuple(key for key in METADATA_KEYS if key not in METADATA_KEYS_TO_OMIT)
 SERVER_URL = format_server_url(get_config("dispatcher.address"), get_config("dispatcher.port"))
 URI_FILTER_POLICY = URIFilterPolicy[get_config("dispatcher.data_uri_filter_policy")]
 
@@ -43,42 +46,38 @@ app_log = logger.app_log
 
 
 # res is assumed to represent a full db record
-def _export_result_meta(res: Result) -> ResultMetadata:
+def _export_result_meta(res: Result, session: Session = None) -> ResultMetadata:
     metadata_kwargs = {
-        key: res.get_metadata(key, None, refresh=False)
-        for key in METADATA_KEYS
-        if key not in METADATA_KEYS_TO_OMIT
+        key: res.get_metadata(key, session, refresh=False) for key in _EXPORT_METADATA_KEYS
     }
     return ResultMetadata(**metadata_kwargs)
 
 
-def _populate_assets(res: Result):
+def _populate_assets(res: Result, session: Session):
     """Prepopulate the asset maps"""
 
-    # Compute mapping from electron_id -> transport_graph_node_id
+    # Compute mapping from electron_id -> transport graph node
 
     tg = res.lattice.transport_graph
-    g = tg.get_internal_graph_copy()
-    all_nodes = tg.get_nodes(node_ids=list(g.nodes))
-
-    eid_node_id_map = {node._electron_id: node.node_id for node in all_nodes}
-
-    with res.session() as session:
-        # Workflow scope
-        workflow_assets = Result.get_linked_assets(
-            session,
-            fields=[],
-            equality_filters={"id": res.metadata.primary_key},
-            membership_filters={},
-        )
-        # Electron scope
-
-        node_assets = Electron.get_linked_assets(
-            session,
-            fields=[],
-            equality_filters={"parent_lattice_id": res.metadata.primary_key},
-            membership_filters={},
-        )
+    all_nodes = tg.get_nodes(node_ids=tg.node_ids(), session=session)
+
+    eid_node_map = {node._electron_id: node for node in all_nodes}
+
+    # Workflow scope
+    workflow_assets = Result.get_linked_assets(
+        session,
+        fields=[],
+        equality_filters={"id": res.metadata.primary_key},
+        membership_filters={},
+    )
+    # Electron scope
+
+    node_assets = Electron.get_linked_assets(
+        session,
+        fields=[],
+        equality_filters={"parent_lattice_id": res.metadata.primary_key},
+        membership_filters={},
+    )
 
     for rec in workflow_assets:
         res.assets[rec["key"]] = rec["asset"]
@@ -87,7 +86,7 @@ def _populate_assets(res: Result):
         res.lattice.assets[key] = val
 
     for rec in node_assets:
-        node = tg.get_node(eid_node_id_map[rec["meta_id"]])
+        node = eid_node_map[rec["meta_id"]]
         node.assets[rec["key"]] = rec["asset"]
 
 
@@ -110,12 +109,15 @@ def _export_result_assets(res: Result) -> ResultAssets:
 def export_result(res: Result) -> ResultSchema:
     """Export a Result object"""
     dispatch_id = res.dispatch_id
-    metadata = _export_result_meta(res)
 
-    _populate_assets(res)
+    # Share one session across the whole export
+    with res.session() as session:
+        metadata = _export_result_meta(res, session)
 
-    assets = _export_result_assets(res)
-    lattice = export_lattice(res.lattice)
+        _populate_assets(res, session)
+
+        assets = _export_result_assets(res)
+        lattice = export_lattice(res.lattice, session)
 
     # Filter asset URIs
 
@@ -123,6 +125,10 @@ def export_result(res: Result) -> ResultSchema:
 
 
 def _filter_remote_uris(manifest: ResultSchema) -> ResultSchema:
+    # The raw policy leaves every URI unchanged
+    if URI_FILTER_POLICY == URIFilterPolicy.raw:
+        return manifest
+
     dispatch_id = manifest.metadata.dispatch_id
 
     # Workflow-level
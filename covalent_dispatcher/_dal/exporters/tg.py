@@ -19,6 +19,8 @@
 
 from typing import List
 
+from sqlalchemy.orm import Session
+
 from covalent._shared_files import logger
 from covalent._shared_files.schemas.edge import EdgeMetadata, EdgeSchema
 from covalent._shared_files.schemas.electron import ElectronSchema
@@ -31,10 +33,9 @@ app_log = logger.app_log
 
 
 # Transport Graphs are assumed to be full, with a complete internal NX graph
-def _export_nodes(tg: _TransportGraph) -> List[ElectronSchema]:
-    g = tg.get_internal_graph_copy()
-    internal_nodes = tg.get_nodes(list(g.nodes), None)
-    export_nodes = [export_electron(e) for e in internal_nodes]
+def _export_nodes(tg: _TransportGraph, session: Session = None) -> List[ElectronSchema]:
+    internal_nodes = tg.get_nodes(tg.node_ids(), session)
+    export_nodes = [export_electron(e, session) for e in internal_nodes]
     return export_nodes
 
 
@@ -49,8 +50,8 @@ def _export_edges(tg: _TransportGraph) -> List[EdgeSchema]:
     return edge_list
 
 
-def export_transport_graph(tg: _TransportGraph) -> TransportGraphSchema:
-    node_list = _export_nodes(tg)
+def export_transport_graph(tg: _TransportGraph, session: Session = None) -> TransportGraphSchema:
+    node_list = _export_nodes(tg, session)
     edge_list = _export_edges(tg)
     app_log.debug(f"Exporting {len(node_list)} nodes and {len(edge_list)} edges")
     return TransportGraphSchema(nodes=node_list, links=edge_list)
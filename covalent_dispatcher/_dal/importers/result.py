@@ -166,6 +166,10 @@ def _connect_result_to_electron(
 
 
 def _filter_remote_uris(manifest: ResultSchema) -> ResultSchema:
+    # The raw policy leaves every URI unchanged
+    if URI_FILTER_POLICY == URIFilterPolicy.raw:
+        return manifest
+
     dispatch_id = manifest.metadata.dispatch_id
 
     # Workflow-level
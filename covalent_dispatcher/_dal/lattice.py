@@ -16,7 +16,7 @@
 
 """DB-backed lattice"""
 
-from typing import Any, List
+from typing import Any, Dict, List
 
 from sqlalchemy.orm import Session
 
@@ -87,3 +87,7 @@ class Lattice(DispatchedObject[LatticeMeta, LatticeAsset]):
 
     def set_value(self, key: str, val: Any, session: Session = None) -> None:
         super().set_value(key, set_filters[key](val), session)
+
+    def set_values(self, values: Dict[str, Any], session: Session = None) -> None:
+        filtered = {key: set_filters[key](val) for key, val in values.items()}
+        super().set_values(filtered, session)
@@ -18,7 +18,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 from sqlalchemy.orm import Session
@@ -42,6 +42,13 @@ app_log = logger.app_log
 RESULT_KEYS = list(_meta_record_map.keys())
 
 
+def _as_naive_utc(ts: datetime) -> datetime:
+    """Express a timestamp as naive UTC, the form stored in the DateTime columns."""
+    if ts.tzinfo is None:
+        return ts
+    return ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class ResultMeta(Record[models.Lattice]):
     model = models.Lattice
 
@@ -138,6 +145,10 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
     def set_value(self, key: str, val: Any, session: Session = None) -> None:
         super().set_value(key, set_filters[key](val), session)
 
+    def set_values(self, values: Dict[str, Any], session: Session = None) -> None:
+        filtered = {key: set_filters[key](val) for key, val in values.items()}
+        super().set_values(filtered, session)
+
     def _update_dispatch(
         self,
         start_time: datetime = None,
@@ -158,17 +169,25 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
 
         """
 
-        with self.session() as session:
-            if start_time is not None:
-                self.set_value("start_time", start_time, session)
-            if end_time is not None:
-                self.set_value("end_time", end_time, session)
-            if status is not None:
-                self.set_value("status", status, session)
-            if error is not None:
-                self.set_value("error", error, session)
-            if result is not None:
-                self.set_value("result", result, session)
+        updates = {
+            "start_time": start_time,
+            "end_time": end_time,
+            "status": status,
+            "error": error,
+            "result": result,
+        }
+        updates = {key: val for key, val in updates.items() if val is not None}
+
+        # Store the wall-clock runtime once so readers don't recompute it
+        if end_time is not None:
+            started = start_time if start_time is not None else self.get_value("start_time")
+            if started is not None:
+                elapsed = _as_naive_utc(end_time) - _as_naive_utc(started)
+                updates["runtime_ms"] = int(elapsed.total_seconds() * 1000)
+
+        # Skip the transaction entirely when there is nothing to write
+        if updates:
+            self.set_values(updates)
 
         # Copy output and error assets to sublattice's parent electron
         if RESULT_STATUS.is_terminal(status) and self._electron_id:
@@ -230,11 +249,23 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
         app_log.debug("Inside update node")
 
         _start_ts = datetime.now()
+        updates = {
+            "status": status,
+            "name": node_name,
+            "start_time": start_time,
+            "end_time": end_time,
+            "output": output,
+            "error": error,
+            "stdout": stdout,
+            "stderr": stderr,
+            "qelectron_data_exists": qelectron_data_exists,
+        }
+        updates = {key: val for key, val in updates.items() if val is not None}
+
         with self.session() as session:
             if status is not None:
                 # This acquires a lock on the electron's row to achieve atomic RMW
                 if self._can_update_node_status(session, node_id, status):
-                    self.lattice.transport_graph.set_node_value(node_id, "status", status, session)
                     if status == RESULT_STATUS.COMPLETED:
                         self.incr_metadata("completed_electron_num", 1, session)
                 else:
@@ -242,40 +273,19 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
                     session.rollback()
                     return False
 
-            # Current node name
-            name = self.lattice.transport_graph.get_node_value(node_id, "name", session)
-
-            if node_name is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "name", node_name, session)
-
-            if start_time is not None:
-                self.lattice.transport_graph.set_node_value(
-                    node_id, "start_time", start_time, session
-                )
-
-            if end_time is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "end_time", end_time, session)
-
-            if output is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "output", output, session)
-
-            if error is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "error", error, session)
+            # Only a finished node can complete the workflow, so skip the
+            # name lookup for all other updates
+            is_postprocess = end_time is not None and self.lattice.transport_graph.get_node_value(
+                node_id, "name", session
+            ).startswith(postprocess_prefix)
 
-            if stdout is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "stdout", stdout, session)
-
-            if stderr is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "stderr", stderr, session)
-
-            if qelectron_data_exists is not None:
-                self.lattice.transport_graph.set_node_value(
-                    node_id, "qelectron_data_exists", qelectron_data_exists, session
-                )
+            # Write all changed metadata columns with a single UPDATE
+            if updates:
+                self.lattice.transport_graph.set_node_values(node_id, updates, session)
 
         # Handle postprocessing node
         tg = self.lattice.transport_graph
-        if name.startswith(postprocess_prefix) and end_time is not None:
+        if is_postprocess:
             app_log.debug(f"Postprocess status: {status}")
             # Copy asset metadata
             with self.session() as session:
@@ -353,19 +363,18 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
                 },
             )
 
-            nodes = list(map(lambda rec: Electron(session, rec, keys=query_keys), records))
-
-            failed = list(filter(lambda e: e.get_value("status") == RESULT_STATUS.FAILED, nodes))
-            cancelled = list(
-                filter(lambda e: e.get_value("status") == RESULT_STATUS.CANCELLED, nodes)
-            )
-
-            failed_nodes = list(
-                map(lambda x: (x.node_id, x.get_metadata("name", session, False)), failed)
-            )
-            cancelled_nodes = list(
-                map(lambda x: (x.node_id, x.get_metadata("name", session, False)), cancelled)
-            )
+            # The selected records already hold every queried field, so
+            # partition them in one pass without refreshing from the DB
+            failed_nodes = []
+            cancelled_nodes = []
+            for rec in records:
+                e = Electron(session, rec, keys=query_keys)
+                status = e.get_value("status", session, False)
+                node = (e.node_id, e.get_metadata("name", session, False))
+                if status == RESULT_STATUS.FAILED:
+                    failed_nodes.append(node)
+                elif status == RESULT_STATUS.CANCELLED:
+                    cancelled_nodes.append(node)
 
         return {"failed": failed_nodes, "cancelled": cancelled_nodes}
 
@@ -380,13 +389,16 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
             node_outputs: A dictionary containing the output of every node execution.
         """
 
-        all_node_outputs = {}
         tg = self.lattice.transport_graph
-        for node_id in tg._graph.nodes:
-            node_name = tg.get_node_value(node_id, "name")
-            node_output = tg.get_node_value(node_id, "output")
-            all_node_outputs[f"{node_name}({node_id})"] = node_output
-        return all_node_outputs
+        node_ids = tg.node_ids()
+
+        # Fetch every node's name and output with a single session
+        with self.session() as session:
+            records = tg.get_values_for_nodes(node_ids, ["name", "output"], session, False)
+
+        return {
+            f"{rec['name']}({node_id})": rec["output"] for node_id, rec in zip(node_ids, records)
+        }
 
     def get_all_assets(self, include_nodes: bool = True) -> Dict[str, List[Asset]]:
         assets = {}
@@ -110,6 +110,11 @@ class _TransportGraph:
         node = self.get_node(node_id, session)
         node.set_value(key, val, session)
 
+    def set_node_values(self, node_id: int, values: Dict[str, Any], session: Session = None):
+        """Set several attributes of a node, batching the metadata writes."""
+        node = self.get_node(node_id, session)
+        node.set_values(values, session)
+
     def get_incoming_edges(self, node_id: int) -> List[Tuple[int, int, Dict]]:
         """Query in-edges of a node.
 
@@ -197,6 +202,10 @@ class _TransportGraph:
     def get_internal_graph_copy(self) -> nx.MultiDiGraph:
         return self._graph.copy()
 
+    def node_ids(self) -> List[int]:
+        """Return the ids of all nodes without copying the graph."""
+        return list(self._graph.nodes)
+
     def get_dependencies(self, node_key: int) -> list:
         """Gets the parent node ids of a node with multiplicity
 
@@ -35,6 +35,25 @@ from . import models
 DEBUG_DB = environ.get("COVALENT_DEBUG_DB") == "1"
 
 
+def _pool_options(db_URL: Optional[str]) -> dict:
+    """Connection pool settings for the engine behind db_URL.
+
+    SQLite uses a non-queued pool, so sizing options only apply to
+    server databases.
+    """
+    options = {
+        "pool_pre_ping": True,
+        "pool_recycle": int(get_config("dispatcher.db_pool_recycle")),
+    }
+    if db_URL and not db_URL.startswith("sqlite"):
+        options.update(
+            pool_size=int(get_config("dispatcher.db_pool_size")),
+            max_overflow=int(get_config("dispatcher.db_max_overflow")),
+            pool_timeout=int(get_config("dispatcher.db_pool_timeout")),
+        )
+    return options
+
+
 class DataStore:
     def __init__(
         self,
@@ -61,7 +80,8 @@ class DataStore:
 
     @staticmethod
     def factory():
-        return DataStore(db_URL=environ.get("COVALENT_DATABASE_URL"), echo=DEBUG_DB)
+        db_URL = environ.get("COVALENT_DATABASE_URL")
+        return DataStore(db_URL=db_URL, echo=DEBUG_DB, **_pool_options(db_URL))
 
     def get_alembic_config(self, logging_enabled: bool = True):
         alembic_ini_path = Path(path.join(__file__, "./../../../covalent_migrations/alembic.ini"))
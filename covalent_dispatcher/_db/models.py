@@ -19,6 +19,7 @@ Models for the workflows db. Based on schema v9
 """
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -29,6 +30,8 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
+    true,
 )
 from sqlalchemy.orm import declarative_base
 
@@ -39,7 +42,22 @@ Base = declarative_base()
 
 class Lattice(Base):
     __tablename__ = "lattices"
-    __table_args__ = (UniqueConstraint("dispatch_id", name="u_dispatch_id"),)
+    __table_args__ = (
+        UniqueConstraint("dispatch_id", name="u_dispatch_id"),
+        # Partial indexes covering the UI's lookups of active lattices
+        Index(
+            "ix_lattices_dispatch_active",
+            "dispatch_id",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_lattices_sublattice_root_active",
+            "root_dispatch_id",
+            postgresql_where=text("electron_id IS NOT NULL AND is_active = true"),
+            sqlite_where=text("electron_id IS NOT NULL AND is_active = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     dispatch_id = Column(String(64), nullable=False)
@@ -123,7 +141,7 @@ class Lattice(Base):
     root_dispatch_id = Column(String(64), nullable=True)
 
     # Name of the column which signifies soft deletion of a lattice
-    is_active = Column(Boolean, nullable=False, default=True)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
 
     # Python version
     python_version = Column(Text)
@@ -137,6 +155,9 @@ class Lattice(Base):
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
 
+    # Wall-clock runtime in milliseconds, set when the lattice completes
+    runtime_ms = Column(BigInteger)
+
 
 class Electron(Base):
     __tablename__ = "electrons"
@@ -105,11 +105,14 @@ class LocalProvider(BaseProvider):
         return storage_path, object_key
 
     def store_file(self, storage_path: str, filename: str, data: Any = None) -> Digest:
-        """This function writes data corresponding to the filepaths in the DB."""
+        """This function writes data corresponding to the filepaths in the DB.
+
+        The data is serialized in memory so that its digest can be
+        computed without reading the file back.
+        """
 
         if filename.endswith(".pkl"):
-            with open(Path(storage_path) / filename, "wb") as f:
-                cloudpickle.dump(data, f)
+            serialized = cloudpickle.dumps(data)
 
         elif filename.endswith(".log") or filename.endswith(".txt"):
             if data is None:
@@ -118,21 +121,22 @@ class LocalProvider(BaseProvider):
             if not isinstance(data, str):
                 raise InvalidFileExtension("Data must be string type.")
 
-            with open(Path(storage_path) / filename, "w+") as f:
-                f.write(data)
+            serialized = data.encode("utf-8")
 
         elif filename.endswith(".tobj"):
-            with open(Path(storage_path) / filename, "wb") as f:
-                f.write(data.serialize())
+            serialized = data.serialize()
 
         elif filename.endswith(".json"):
-            with open(Path(storage_path) / filename, "w") as f:
-                json.dump(data, f)
+            serialized = json.dumps(data).encode("utf-8")
         else:
             raise InvalidFileExtension("The file extension is not supported.")
 
-        digest = self.digest(bucket_name=storage_path, object_key=filename)
-        return digest
+        with open(Path(storage_path) / filename, "wb") as f:
+            f.write(serialized)
+
+        return Digest(
+            algorithm=ALGORITHM, hexdigest=hashlib.new(ALGORITHM, serialized).hexdigest()
+        )
 
     def load_file(self, storage_path: str, filename: str) -> Any:
         """This function loads data for the filenames in the DB."""
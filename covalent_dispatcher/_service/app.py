@@ -19,6 +19,7 @@
 
 import asyncio
 import json
+from collections import deque
 from contextlib import asynccontextmanager
 from typing import List, Optional, Union
 from uuid import UUID
@@ -64,7 +65,8 @@ async def lifespan(app: FastAPI):
     # core_runner._job_event_listener = asyncio.create_task(core_runner._listen_for_job_events())
 
     # Dispatcher event queue and listener
-    core_dispatcher._global_status_queue = asyncio.Queue()
+    core_dispatcher._global_status_queue = deque()
+    core_dispatcher._global_status_event = asyncio.Event()
     core_dispatcher._global_event_listener = asyncio.create_task(
         core_dispatcher._node_event_listener()
     )
@@ -19,12 +19,13 @@
 import asyncio
 import mmap
 import os
+import tarfile
 from functools import lru_cache
-from typing import Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 import aiofiles
 import aiofiles.os
-from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi import APIRouter, Body, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from furl import furl
 
@@ -123,6 +124,43 @@ def get_node_asset(
         raise
 
 
+@router.post("/dispatches/{dispatch_id}/electrons/assets/{key}")
+def get_node_assets(
+    dispatch_id: str,
+    key: ElectronAssetKey,
+    node_ids: List[int] = Body(...),
+):
+    """Returns an asset for several electrons in a single response.
+
+    Args:
+        dispatch_id: The dispatch's unique id.
+        key: The name of the asset
+        node_ids: (request body) The ids of the electrons
+
+    The assets are streamed as an uncompressed tar archive in which
+    each member is named after its node id.
+    """
+
+    try:
+        app_log.debug(f"Requested asset {key.value} for nodes {dispatch_id}:{node_ids}")
+
+        result_object = get_cached_result_object(dispatch_id)
+        tg = result_object.lattice.transport_graph
+
+        with workflow_db.session() as session:
+            file_urls = {}
+            for node_id in node_ids:
+                asset = tg.get_node(node_id).get_asset(key=key.value, session=session)
+                file_urls[str(node_id)] = asset.internal_uri
+
+        generator = _generate_tar_stream(file_urls)
+        return StreamingResponse(generator, media_type="application/x-tar")
+
+    except Exception as e:
+        app_log.debug(e)
+        raise
+
+
 @router.get("/dispatches/{dispatch_id}/assets/{key}")
 def get_dispatch_asset(
     dispatch_id: str,
@@ -370,6 +408,31 @@ def _generate_file_slice(file_url: str, start_byte: int, end_byte: int, chunk_si
             yield f.read(end_byte - byte_pos)
 
 
+def _generate_tar_stream(file_urls: Dict[str, str], chunk_size: int = 65536):
+    """Generator of an uncompressed tar archive of several files.
+
+    Args:
+        file_urls: A mapping from member names to file:/// type URLs
+        chunk_size: The size of each file chunk
+
+    Returns:
+        Yields tar headers and file chunks of size <= chunk_size
+    """
+    for name, file_url in file_urls.items():
+        tarinfo = tarfile.TarInfo(name)
+        tarinfo.size = os.path.getsize(str(furl(file_url).path))
+        yield tarinfo.tobuf(format=tarfile.PAX_FORMAT)
+        yield from _generate_file_slice(file_url, 0, tarinfo.size, chunk_size)
+
+        # Members are padded to a whole number of blocks
+        remainder = tarinfo.size % tarfile.BLOCKSIZE
+        if remainder:
+            yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
+
+    # End-of-archive marker
+    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+
+
 def _extract_byte_range(byte_range_header: str) -> Tuple[int, int]:
     """Extract the byte range from a range request header."""
     start_byte = 0
@@ -33,19 +33,36 @@ branch_labels = None
 depends_on = None
 
 
+# Columns added to the lattices table in this revision
+_NEW_LATTICE_COLUMNS = (
+    ("docstring_filename", sa.Text()),
+    ("deps_filename", sa.Text()),
+    ("call_before_filename", sa.Text()),
+    ("call_after_filename", sa.Text()),
+    ("cova_imports_filename", sa.Text()),
+    ("lattice_imports_filename", sa.Text()),
+    ("results_dir", sa.Text()),
+    ("root_dispatch_id", sa.String(length=64)),
+)
+
+
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("lattices", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("docstring_filename", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("deps_filename", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("call_before_filename", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("call_after_filename", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("cova_imports_filename", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("lattice_imports_filename", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("results_dir", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("root_dispatch_id", sa.String(length=64), nullable=True))
+    bind = op.get_bind()
 
-    # ### end Alembic commands ###
+    # Postgres can add every column in one ALTER TABLE statement
+    if bind.dialect.name == "postgresql":
+        add_columns = ", ".join(
+            f"ADD COLUMN {name} {type_.compile(dialect=bind.dialect)}"
+            for name, type_ in _NEW_LATTICE_COLUMNS
+        )
+        op.execute(f"ALTER TABLE lattices {add_columns}")
+        return
+
+    # All columns are nullable, so "auto" uses native ADD COLUMN instead of
+    # recreating the table
+    with op.batch_alter_table("lattices", schema=None, recreate="auto") as batch_op:
+        for name, type_ in _NEW_LATTICE_COLUMNS:
+            batch_op.add_column(sa.Column(name, type_, nullable=True))
 
 
 def downgrade() -> None:
@@ -0,0 +1,59 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""add partial indexes on active lattices
+
+Revision ID: 8a1f0d6c4e27
+Revises: 3c6ae3f1b9f4
+Create Date: 2026-10-15 11:03:07.914226
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+# pragma: allowlist nextline secret
+revision = "8a1f0d6c4e27"
+# pragma: allowlist nextline secret
+down_revision = "3c6ae3f1b9f4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("lattices", schema=None) as batch_op:
+        batch_op.alter_column("is_active", existing_type=sa.Boolean(), server_default=sa.true())
+        batch_op.create_index(
+            "ix_lattices_dispatch_active",
+            ["dispatch_id"],
+            unique=False,
+            postgresql_where=sa.text("is_active = true"),
+            sqlite_where=sa.text("is_active = 1"),
+        )
+        batch_op.create_index(
+            "ix_lattices_sublattice_root_active",
+            ["root_dispatch_id"],
+            unique=False,
+            postgresql_where=sa.text("electron_id IS NOT NULL AND is_active = true"),
+            sqlite_where=sa.text("electron_id IS NOT NULL AND is_active = 1"),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("lattices", schema=None) as batch_op:
+        batch_op.drop_index("ix_lattices_sublattice_root_active")
+        batch_op.drop_index("ix_lattices_dispatch_active")
+        batch_op.alter_column("is_active", existing_type=sa.Boolean(), server_default=None)
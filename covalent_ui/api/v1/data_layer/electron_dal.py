@@ -16,13 +16,14 @@
 
 import codecs
 import pickle
+import time
 import uuid
 from datetime import timedelta
 from pathlib import Path
 
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
-from sqlalchemy import extract, select
+from sqlalchemy import Float, bindparam, extract, select
 from sqlalchemy.sql import func
 
 from covalent._results_manager.results_manager import get_result
@@ -272,7 +273,7 @@ class Electrons:
                     (
                         func.coalesce(
                             extract("epoch", Electron.completed_at),
-                            extract("epoch", func.now()),
+                            bindparam("now_epoch", time.time(), type_=Float),
                         )
                         - extract("epoch", Electron.started_at)
                     )
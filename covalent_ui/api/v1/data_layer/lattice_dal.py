@@ -16,16 +16,115 @@
 
 """Lattice Data Layer"""
 
-from typing import List
+import time
+from typing import Dict, Iterator, List
 from uuid import UUID
 
-from sqlalchemy import extract, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, bindparam, extract, select, true
+from sqlalchemy.orm import Session, with_loader_criteria
 from sqlalchemy.sql import desc, func
 
 from covalent_ui.api.v1.database.schema.lattices import Lattice
 from covalent_ui.api.v1.models.dispatch_model import SortDirection
-from covalent_ui.api.v1.models.lattices_model import LatticeDetailResponse
+from covalent_ui.api.v1.models.lattices_model import LatticeDetailResponse, SubLatticeSortBy
+
+# Statements are built once with bound parameters so that each request
+# only binds values and reuses SQLAlchemy's compiled statement cache.
+
+# Completed lattices carry a precomputed runtime_ms; running ones are
+# measured against a "now_epoch" value bound once per request.
+_RUNTIME = func.coalesce(
+    Lattice.runtime_ms,
+    (
+        func.coalesce(extract("epoch", Lattice.completed_at), bindparam("now_epoch", type_=Float))
+        - extract("epoch", Lattice.started_at)
+    )
+    * 1000,
+).label("runtime")
+
+# Restricts every lattice statement below to active (not soft deleted) rows
+_ACTIVE_LATTICES = with_loader_criteria(Lattice, Lattice.is_active == true())
+
+# Union of the columns needed by the lattice detail and lattice file views
+_LATTICE_FULL_STMT = (
+    select(
+        Lattice.dispatch_id,
+        Lattice.status,
+        Lattice.storage_path.label("directory"),
+        Lattice.storage_type,
+        Lattice.error_filename,
+        Lattice.results_filename,
+        Lattice.docstring_filename,
+        Lattice.function_string_filename,
+        Lattice.function_filename,
+        Lattice.inputs_filename,
+        Lattice.executor,
+        Lattice.executor_data,
+        Lattice.workflow_executor,
+        Lattice.workflow_executor_data,
+        Lattice.started_at.label("start_time"),
+        Lattice.started_at.label("started_at"),
+        func.coalesce((Lattice.completed_at), None).label("end_time"),
+        Lattice.completed_at.label("ended_at"),
+        Lattice.electron_num.label("total_electrons"),
+        Lattice.completed_electron_num.label("total_electrons_completed"),
+        _RUNTIME,
+        func.coalesce((Lattice.updated_at), None).label("updated_at"),
+    )
+    .where(Lattice.dispatch_id == bindparam("dispatch_id"))
+    .options(_ACTIVE_LATTICES)
+)
+
+_SUB_LATTICE_STMT = (
+    select(
+        Lattice.dispatch_id.label("dispatch_id"),
+        Lattice.name.label("lattice_name"),
+        _RUNTIME,
+        Lattice.electron_num.label("total_electrons"),
+        Lattice.completed_electron_num.label("total_electrons_completed"),
+        Lattice.status.label("status"),
+        Lattice.started_at.label("started_at"),
+        func.coalesce((Lattice.completed_at), None).label("ended_at"),
+        Lattice.updated_at.label("updated_at"),
+    )
+    .where(
+        Lattice.electron_id.is_not(None),
+        Lattice.root_dispatch_id == bindparam("dispatch_id"),
+    )
+    .options(_ACTIVE_LATTICES)
+)
+
+_SUB_LATTICE_BATCH_STMT = (
+    select(
+        *_SUB_LATTICE_STMT.selected_columns,
+        Lattice.root_dispatch_id.label("root_dispatch_id"),
+    )
+    .where(
+        Lattice.electron_id.is_not(None),
+        Lattice.root_dispatch_id.in_(bindparam("root_dispatch_ids", expanding=True)),
+    )
+    .options(_ACTIVE_LATTICES)
+)
+
+
+def _order_by(stmt, sort_by, sort_direction):
+    return stmt.order_by(
+        desc(sort_by.value) if sort_direction == SortDirection.DESCENDING else sort_by.value
+    )
+
+
+# One prebuilt statement per (sort_by, sort_direction) combination
+_SUB_LATTICE_SORTED_STMTS = {
+    (sort_by, sort_direction): _order_by(_SUB_LATTICE_STMT, sort_by, sort_direction)
+    for sort_by in SubLatticeSortBy
+    for sort_direction in SortDirection
+}
+
+_SUB_LATTICE_BATCH_SORTED_STMTS = {
+    (sort_by, sort_direction): _order_by(_SUB_LATTICE_BATCH_STMT, sort_by, sort_direction)
+    for sort_by in SubLatticeSortBy
+    for sort_direction in SortDirection
+}
 
 
 class Lattices:
@@ -39,6 +138,20 @@ class Lattices:
             select(Lattice).where(Lattice.dispatch_id == str(dispatch_id))
         ).fetchone()
 
+    def get_lattices_id_full(self, dispatch_id: UUID):
+        """
+        Get lattice details along with file names in a single query
+        Args:
+            dispatch_id: Refers to the dispatch_id in lattices table
+        Return:
+            Top most lattice with the given dispatch_id
+            (i.e lattice with the same dispatch_id, but electron_id as null)
+        """
+
+        return self.db_con.execute(
+            _LATTICE_FULL_STMT, {"dispatch_id": str(dispatch_id), "now_epoch": time.time()}
+        ).first()
+
     def get_lattices_id(self, dispatch_id: UUID) -> LatticeDetailResponse:
         """
         Get lattices from dispatch id
@@ -49,33 +162,7 @@ class Lattices:
             (i.e lattice with the same dispatch_id, but electron_id as null)
         """
 
-        return (
-            self.db_con.query(
-                Lattice.dispatch_id,
-                Lattice.status,
-                Lattice.storage_path.label("directory"),
-                Lattice.error_filename,
-                Lattice.results_filename,
-                Lattice.docstring_filename,
-                Lattice.started_at.label("start_time"),
-                func.coalesce((Lattice.completed_at), None).label("end_time"),
-                Lattice.electron_num.label("total_electrons"),
-                Lattice.completed_electron_num.label("total_electrons_completed"),
-                (
-                    (
-                        func.coalesce(
-                            extract("epoch", Lattice.completed_at),
-                            extract("epoch", func.now()),
-                        )
-                        - extract("epoch", Lattice.started_at)
-                    )
-                    * 1000
-                ).label("runtime"),
-                func.coalesce((Lattice.updated_at), None).label("updated_at"),
-            )
-            .filter(Lattice.dispatch_id == str(dispatch_id), Lattice.is_active.is_not(False))
-            .first()
-        )
+        return self.get_lattices_id_full(dispatch_id)
 
     def get_lattices_id_storage_file(self, dispatch_id: UUID):
         """
@@ -87,72 +174,76 @@ class Lattices:
             (i.e lattice with the same dispatch_id, but electron_id as null)
         """
 
-        return (
-            self.db_con.query(
-                Lattice.dispatch_id,
-                Lattice.status,
-                Lattice.storage_path.label("directory"),
-                Lattice.error_filename,
-                Lattice.function_string_filename,
-                Lattice.executor,
-                Lattice.executor_data,
-                Lattice.workflow_executor,
-                Lattice.workflow_executor_data,
-                Lattice.error_filename,
-                Lattice.inputs_filename,
-                Lattice.results_filename,
-                Lattice.storage_type,
-                Lattice.function_filename,
-                Lattice.started_at.label("started_at"),
-                Lattice.completed_at.label("ended_at"),
-                Lattice.electron_num.label("total_electrons"),
-                Lattice.completed_electron_num.label("total_electrons_completed"),
-            )
-            .filter(Lattice.dispatch_id == str(dispatch_id), Lattice.is_active.is_not(False))
-            .first()
-        )
+        return self.get_lattices_id_full(dispatch_id)
 
-    def get_sub_lattice_details(self, sort_by, sort_direction, dispatch_id) -> List[Lattice]:
+    def get_sub_lattice_details(
+        self, sort_by, sort_direction, dispatch_id, count=None, offset=0
+    ) -> List[Lattice]:
         """
         Get summary of sub lattices
         Args:
             req.sort_by: sort by field name(run_time, status, lattice_name)
             req.direction: sort by direction ASE, DESC
+            req.count: number of rows to be selected (all rows if None)
+            req.offset: number rows to be skipped
         Return:
             List of sub Lattices
         """
 
-        data = (
-            self.db_con.query(
-                Lattice.dispatch_id.label("dispatch_id"),
-                Lattice.name.label("lattice_name"),
-                (
-                    (
-                        func.coalesce(
-                            extract("epoch", Lattice.completed_at), extract("epoch", func.now())
-                        )
-                        - extract("epoch", Lattice.started_at)
-                    )
-                    * 1000
-                ).label("runtime"),
-                Lattice.electron_num.label("total_electrons"),
-                Lattice.completed_electron_num.label("total_electrons_completed"),
-                Lattice.status.label("status"),
-                Lattice.started_at.label("started_at"),
-                func.coalesce((Lattice.completed_at), None).label("ended_at"),
-                Lattice.updated_at.label("updated_at"),
-            )
-            .filter(
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_not(None),
-                Lattice.root_dispatch_id == str(dispatch_id),
-            )
-            .order_by(
-                desc(sort_by.value)
-                if sort_direction == SortDirection.DESCENDING
-                else sort_by.value
-            )
-            .all()
+        stmt = _SUB_LATTICE_SORTED_STMTS[(sort_by, sort_direction)].offset(offset)
+
+        if count is not None:
+            stmt = stmt.limit(count)
+
+        return self.db_con.execute(
+            stmt, {"dispatch_id": str(dispatch_id), "now_epoch": time.time()}
+        ).all()
+
+    def iter_sub_lattice_details(
+        self, sort_by, sort_direction, dispatch_id, partition_size=256
+    ) -> Iterator[List[Lattice]]:
+        """
+        Stream summary of sub lattices
+        Args:
+            req.sort_by: sort by field name(run_time, status, lattice_name)
+            req.direction: sort by direction ASE, DESC
+            req.partition_size: number of rows fetched from the database at a time
+        Return:
+            Generator of lists of sub Lattices, at most partition_size long
+        """
+
+        stmt = _SUB_LATTICE_SORTED_STMTS[(sort_by, sort_direction)].execution_options(
+            yield_per=partition_size
         )
+        result = self.db_con.execute(
+            stmt, {"dispatch_id": str(dispatch_id), "now_epoch": time.time()}
+        )
+        yield from result.partitions()
+
+    def get_sub_lattice_details_batch(
+        self,
+        root_dispatch_ids: List[str],
+        sort_by=SubLatticeSortBy.RUNTIME,
+        sort_direction=SortDirection.DESCENDING,
+    ) -> Dict[str, List[Lattice]]:
+        """
+        Get summary of sub lattices for several root dispatches in one query
+        Args:
+            root_dispatch_ids: dispatch ids of the root lattices
+            sort_by: sort by field name(run_time, status, lattice_name)
+            sort_direction: sort by direction ASE, DESC
+        Return:
+            Sub lattices grouped by root dispatch id
+        """
+
+        sub_lattices = {str(dispatch_id): [] for dispatch_id in root_dispatch_ids}
+        if not sub_lattices:
+            return sub_lattices
 
-        return data
+        rows = self.db_con.execute(
+            _SUB_LATTICE_BATCH_SORTED_STMTS[(sort_by, sort_direction)],
+            {"root_dispatch_ids": list(sub_lattices), "now_epoch": time.time()},
+        ).all()
+        for row in rows:
+            sub_lattices[row.root_dispatch_id].append(row)
+        return sub_lattices
@@ -14,11 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import case, extract, update
+from sqlalchemy import Float, bindparam, case, extract, update
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import desc, func, or_
 from sqlalchemy.util import immutabledict
@@ -68,7 +69,7 @@ class Summary:
                 (
                     func.coalesce(
                         extract("epoch", Lattice.completed_at),
-                        extract("epoch", func.now()),
+                        bindparam("now_epoch", time.time(), type_=Float),
                     )
                     - extract("epoch", Lattice.started_at)
                 )
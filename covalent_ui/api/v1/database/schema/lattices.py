@@ -15,7 +15,7 @@
 # limitations under the License.
 
 """Lattices schema"""
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, String, Text, func
 
 from covalent_ui.api.v1.database.config.db import Base
 
@@ -43,6 +43,7 @@ class Lattice(Base):
         updated_at: updated timestamp
         started_at: started timestamp
         completed_at: completed timestamp
+        runtime_ms: runtime in milliseconds, set when the lattice completes
     """
 
     __tablename__ = "lattices"
@@ -135,3 +136,6 @@ class Lattice(Base):
     updated_at = Column(DateTime, nullable=False, onupdate=func.now(), server_default=func.now())
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
+
+    # Wall-clock runtime in milliseconds, set when the lattice completes
+    runtime_ms = Column(BigInteger)
@@ -21,11 +21,13 @@ import uuid
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
+from pydantic import conint
 from sqlalchemy.orm import Session
 
 import covalent_ui.api.v1.database.config.db as db
 from covalent_ui.api.v1.data_layer.lattice_dal import Lattices
-from covalent_ui.api.v1.models.dispatch_model import SortDirection
+from covalent_ui.api.v1.models.dispatch_model import DispatchModule, SortDirection
 from covalent_ui.api.v1.models.lattices_model import (
     LatticeDetailResponse,
     LatticeExecutorResponse,
@@ -156,6 +158,8 @@ def get_sub_lattice(
     sort_by: Optional[SubLatticeSortBy] = Query(default=SubLatticeSortBy.RUNTIME),
     sort_direction: Optional[SortDirection] = Query(default=SortDirection.DESCENDING),
     dispatch_id: uuid.UUID = Path(title="dispatch id"),
+    count: Optional[conint(gt=0)] = Query(default=None),
+    offset: Optional[conint(gt=-1)] = Query(default=0),
 ):
     """Get All Sub Lattices
 
@@ -168,6 +172,41 @@ def get_sub_lattice(
     with Session(db.engine) as session:
         lattice = Lattices(session)
         data = lattice.get_sub_lattice_details(
-            dispatch_id=dispatch_id, sort_by=sort_by, sort_direction=sort_direction
+            dispatch_id=dispatch_id,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            count=count,
+            offset=offset,
         )
         return SubLatticeDetailResponse(sub_lattices=data)
+
+
+@routes.get("/{dispatch_id}/sublattices/stream")
+def stream_sub_lattice(
+    sort_by: Optional[SubLatticeSortBy] = Query(default=SubLatticeSortBy.RUNTIME),
+    sort_direction: Optional[SortDirection] = Query(default=SortDirection.DESCENDING),
+    dispatch_id: uuid.UUID = Path(title="dispatch id"),
+):
+    """Stream All Sub Lattices
+
+    Args:
+        req: Dispatch ID
+
+    Returns:
+        Sub Lattices details as newline delimited JSON
+    """
+
+    def sub_lattice_lines():
+        with Session(db.engine) as session:
+            lattice = Lattices(session)
+            for partition in lattice.iter_sub_lattice_details(
+                dispatch_id=dispatch_id,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            ):
+                yield "".join(
+                    DispatchModule.model_validate(row).model_dump_json() + "\n"
+                    for row in partition
+                )
+
+    return StreamingResponse(sub_lattice_lines(), media_type="application/x-ndjson")
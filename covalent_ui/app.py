@@ -124,6 +124,9 @@ if __name__ == "__main__":
 
         tr_app.disable_triggers = True
 
+    # "auto" selects uvloop when it is installed and falls back to asyncio
+    loop = "auto" if get_config("dispatcher.use_uvloop") == "true" else "asyncio"
+
     # Start covalent main app
     uvicorn.run(
         app_name,
@@ -131,5 +134,6 @@ if __name__ == "__main__":
         port=port,
         debug=DEBUG,
         reload=RELOAD,
+        loop=loop,
         log_config=log_config(),
     )
@@ -311,12 +311,20 @@ async def test_get_initial_tasks_and_deps(mocker, test_db):
         side_effect=get_graph_nodes_links,
     )
 
-    initial_nodes, pending_parents, sorted_task_groups = await _get_initial_tasks_and_deps(
-        dispatch_id
-    )
+    (
+        initial_nodes,
+        pending_parents,
+        sorted_task_groups,
+        abstract_inputs,
+    ) = await _get_initial_tasks_and_deps(dispatch_id)
 
     assert initial_nodes == [1]
 
     # Account for injected postprocess electron
     assert pending_parents == {0: 1, 1: 0, 2: 1, 3: 3}
     assert sorted_task_groups == {0: [0], 1: [1], 2: [2], 3: [3]}
+
+    # tg edges are (1, 0), (0, 2)
+    assert abstract_inputs[0] == {"args": [1], "kwargs": {}}
+    assert abstract_inputs[1] == {"args": [], "kwargs": {}}
+    assert abstract_inputs[2] == {"args": [0], "kwargs": {}}
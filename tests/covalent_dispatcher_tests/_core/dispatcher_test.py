@@ -488,7 +488,7 @@ async def test_submit_initial_tasks(mocker):
 
     mocker.patch(
         "covalent_dispatcher._core.dispatcher._get_initial_tasks_and_deps",
-        return_value=(initial_groups, {1: 0, 2: 0}, sorted_groups),
+        return_value=(initial_groups, {1: 0, 2: 0}, sorted_groups, {}),
     )
     mocker.patch(
         "covalent_dispatcher._core.dispatcher.datasvc.generate_dispatch_result",
@@ -536,17 +536,15 @@ async def test_submit_task_group_single(mocker):
         {"status": Result.NEW_OBJ},
     ]
 
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
+    async def get_bulk_electron_attrs(dispatch_id, node_ids, keys):
+        return [
+            {key: status[key] if key == "status" else mock_attrs[key] for key in keys}
+            for status in mock_statuses
+        ]
 
-    mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
-    )
-
-    mocker.patch(
+    mock_get_bulk = mocker.patch(
         "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
-        return_value=mock_statuses,
+        side_effect=get_bulk_electron_attrs,
     )
 
     mocker.patch(
@@ -561,6 +559,7 @@ async def test_submit_task_group_single(mocker):
     await _submit_task_group(dispatch_id, nodes, gid)
     mock_run_abs_task.assert_called()
     assert mock_get_abs_input.await_count == len(nodes)
+    mock_get_bulk.assert_awaited_once()
 
 
 # Temporary only because the current runner does not support
@@ -590,17 +589,15 @@ async def test_submit_task_group_multiple(mocker):
         {"status": Result.NEW_OBJ},
     ]
 
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
+    async def get_bulk_electron_attrs(dispatch_id, node_ids, keys):
+        return [
+            {key: status[key] if key == "status" else mock_attrs[key] for key in keys}
+            for status in mock_statuses
+        ]
 
-    mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
-    )
-
-    mocker.patch(
+    mock_get_bulk = mocker.patch(
         "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
-        return_value=mock_statuses,
+        side_effect=get_bulk_electron_attrs,
     )
 
     mocker.patch(
@@ -641,17 +638,15 @@ async def test_submit_task_group_skips_reusable(mocker):
         {"status": Result.PENDING_REUSE},
     ]
 
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
+    async def get_bulk_electron_attrs(dispatch_id, node_ids, keys):
+        return [
+            {key: status[key] if key == "status" else mock_attrs[key] for key in keys}
+            for status in mock_statuses
+        ]
 
-    mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
-    )
-
-    mocker.patch(
+    mock_get_bulk = mocker.patch(
         "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
-        return_value=mock_statuses,
+        side_effect=get_bulk_electron_attrs,
     )
 
     mock_update = mocker.patch(
@@ -678,17 +673,18 @@ async def test_submit_parameter(mocker):
 
     mock_attrs = {
         "name": parameter_prefix,
+        "status": Result.NEW_OBJ,
         "value": 5,
         "executor": "local",
         "executor_data": {},
     }
 
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
+    async def get_bulk_electron_attrs(dispatch_id, node_ids, keys):
+        return [{key: mock_attrs[key] for key in keys} for _ in node_ids]
 
     mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        get_bulk_electron_attrs,
     )
 
     mock_update = mocker.patch(
@@ -706,6 +702,50 @@ async def test_submit_parameter(mocker):
     mock_update.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_get_abstract_task_inputs_uses_cache(mocker):
+    """Check that precomputed abstract inputs skip the edge query"""
+    from covalent_dispatcher._core.dispatcher import (
+        _abstract_task_inputs,
+        _get_abstract_task_inputs,
+    )
+
+    dispatch_id = "dispatch_abstract_inputs"
+    inputs = {"args": [0, 1], "kwargs": {"y": 2}}
+    mock_get_edges = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_incoming_edges",
+    )
+
+    await _abstract_task_inputs.set_inputs(dispatch_id, 3, inputs)
+    assert await _get_abstract_task_inputs(dispatch_id, 3, "task") == inputs
+    mock_get_edges.assert_not_awaited()
+
+    await _abstract_task_inputs.remove(dispatch_id, 3)
+
+
+@pytest.mark.asyncio
+async def test_node_event_listener_drains_queue(mocker):
+    """Check that the event listener handles every queued status update"""
+    import asyncio
+    from collections import deque
+
+    from covalent_dispatcher._core.dispatcher import _node_event_listener, notify_node_status
+
+    mocker.patch("covalent_dispatcher._core.dispatcher._global_status_queue", deque())
+    mocker.patch("covalent_dispatcher._core.dispatcher._global_status_event", asyncio.Event())
+    mock_handle_event = mocker.patch("covalent_dispatcher._core.dispatcher._handle_event")
+
+    listener = asyncio.create_task(_node_event_listener())
+    await notify_node_status("dispatch", 0, Result.COMPLETED)
+    await notify_node_status("dispatch", 1, Result.FAILED)
+    await asyncio.sleep(0.1)
+    listener.cancel()
+
+    assert mock_handle_event.call_count == 2
+    assert mock_handle_event.call_args_list[0].args[0]["node_id"] == 0
+    assert mock_handle_event.call_args_list[1].args[0]["node_id"] == 1
+
+
 @pytest.mark.asyncio
 async def test_clear_caches(mocker):
     import networkx as nx
@@ -716,8 +756,10 @@ async def test_clear_caches(mocker):
     g.add_node(2, task_group_id=0)
     g.add_node(3, task_group_id=3)
 
-    mocker.patch("covalent_dispatcher._core.dispatcher.tg_utils.get_nodes_links")
-    mocker.patch("networkx.readwrite.node_link_graph", return_value=g)
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_nodes_links",
+        return_value=nx.readwrite.node_link_data(g),
+    )
     mock_unresolved_remove = mocker.patch(
         "covalent_dispatcher._core.dispatcher._unresolved_tasks.remove"
     )
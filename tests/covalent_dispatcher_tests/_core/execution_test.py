@@ -20,6 +20,7 @@ Integration tests for the dispatcher, runner, and result modules
 
 import asyncio
 import uuid
+from collections import deque
 from typing import Dict, List
 
 import pytest
@@ -268,7 +269,8 @@ async def test_run_workflow_does_not_deserialize(test_db, mocker):
         "covalent_dispatcher._core.runner.datasvc.get_result_object", return_value=result_object
     )
 
-    mocker.patch("covalent_dispatcher._core.dispatcher._global_status_queue", asyncio.Queue())
+    mocker.patch("covalent_dispatcher._core.dispatcher._global_status_queue", deque())
+    mocker.patch("covalent_dispatcher._core.dispatcher._global_status_event", asyncio.Event())
 
     update.persist(result_object)
 
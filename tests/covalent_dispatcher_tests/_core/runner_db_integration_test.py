@@ -25,7 +25,7 @@ from sqlalchemy.pool import StaticPool
 import covalent as ct
 from covalent._results_manager import Result
 from covalent._workflow.lattice import Lattice
-from covalent_dispatcher._core.runner import _gather_deps
+from covalent_dispatcher._core.runner import _assemble_deps, _gather_deps
 from covalent_dispatcher._dal.result import Result as SRVResult
 from covalent_dispatcher._dal.result import get_result_object
 from covalent_dispatcher._db import update
@@ -121,3 +121,10 @@ async def test_gather_deps(mocker, test_db):
     before, after = await _gather_deps(result_object.dispatch_id, 0)
     assert len(before) == 3
     assert len(after) == 1
+
+    # Identical deps are only rehydrated once
+    hits = _assemble_deps.cache_info().hits
+    before_again, after_again = await _gather_deps(result_object.dispatch_id, 0)
+    assert _assemble_deps.cache_info().hits == hits + 1
+    assert before_again == before
+    assert after_again == after
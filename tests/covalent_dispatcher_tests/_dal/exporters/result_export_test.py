@@ -24,7 +24,7 @@ import covalent as ct
 from covalent._results_manager.result import Result as SDKResult
 from covalent._serialize.result import serialize_result
 from covalent._shared_files.schemas.result import ResultSchema
-from covalent_dispatcher._dal.exporters.result import export_result
+from covalent_dispatcher._dal.exporters.result import _filter_remote_uris, export_result
 from covalent_dispatcher._dal.importers.result import import_result
 from covalent_dispatcher._dal.result import Result
 from covalent_dispatcher._db.datastore import DataStore
@@ -92,3 +92,17 @@ def test_export_result(mocker, test_db):
 
     for i, edge in enumerate(tg.links):
         assert edge == tg.links[i]
+
+
+def test_filter_remote_uris_raw_policy(mocker):
+    """Check that the raw URI policy skips filtering entirely"""
+    from covalent_dispatcher._dal.utils.uri_filters import URIFilterPolicy
+
+    mocker.patch(
+        "covalent_dispatcher._dal.exporters.result.URI_FILTER_POLICY", URIFilterPolicy.raw
+    )
+    mock_filter = mocker.patch("covalent_dispatcher._dal.exporters.result.filter_asset_uri")
+    manifest = mocker.MagicMock()
+
+    assert _filter_remote_uris(manifest) is manifest
+    mock_filter.assert_not_called()
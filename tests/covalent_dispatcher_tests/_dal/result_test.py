@@ -18,7 +18,7 @@
 
 
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -152,6 +152,42 @@ def test_result_get_set_value(test_db, mocker):
     assert srvres.error == "RuntimeException"
     assert srvres.status == SDKResult.RUNNING
     assert srvres.result.get_deserialized() == 5
+    assert srvres.get_value("runtime_ms") == int((end_time - start_time).total_seconds() * 1000)
+
+    # No-op updates shouldn't open a transaction
+    mock_session = mocker.patch.object(srvres, "session")
+    srvres._update_dispatch()
+    mock_session.assert_not_called()
+
+
+def test_result_update_dispatch_aware_end_time(test_db, mocker):
+    """Runtime is computed when only a tz-aware end time is passed."""
+    res = get_mock_result()
+    res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+
+    with test_db.session() as session:
+        record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "mock_dispatch")
+            .first()
+        )
+
+        srvres = Result(session, record)
+
+    start_time = datetime.now(timezone.utc)
+    srvres._update_dispatch(start_time=start_time, status=SDKResult.RUNNING)
+
+    end_time = start_time + timedelta(seconds=3)
+    srvres._update_dispatch(end_time=end_time, status=SDKResult.COMPLETED)
+
+    assert srvres.status == SDKResult.COMPLETED
+    assert srvres.get_value("runtime_ms") == 3000
 
 
 def test_result_update_node(test_db, mocker):
@@ -340,6 +376,42 @@ def test_result_update_node_handles_postprocessing(test_db, mocker):
     assert srvres.get_value("result").get_deserialized() == 1
 
 
+def test_result_update_node_reads_name_only_when_finished(test_db, mocker):
+    """Check that node updates only look up the node name once the node has finished."""
+
+    import datetime
+
+    from covalent_dispatcher._dal.tg import _TransportGraph
+
+    res = get_mock_result()
+    res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+
+    get_node_value_spy = mocker.spy(_TransportGraph, "get_node_value")
+    timestamp = datetime.datetime.now()
+
+    # Each update builds a fresh result object, as in the electron data module
+    get_result_object("mock_dispatch", True)._update_node(
+        node_id=0, start_time=timestamp, status=SDKResult.RUNNING
+    )
+    get_result_object("mock_dispatch", True)._update_node(node_id=0, stdout="Hello\n")
+
+    name_lookups = [c for c in get_node_value_spy.call_args_list if c.args[2] == "name"]
+    assert not name_lookups
+
+    get_result_object("mock_dispatch", True)._update_node(
+        node_id=0, end_time=timestamp, status=SDKResult.COMPLETED
+    )
+
+    name_lookups = [c for c in get_node_value_spy.call_args_list if c.args[2] == "name"]
+    assert len(name_lookups) == 1
+
+
 def test_get_result_object(test_db, mocker):
     res = get_mock_result()
     res._initialize_nodes()
@@ -388,6 +460,11 @@ def test_get_failed_nodes(test_db, mocker):
     assert len(failed_nodes) == 1
     assert failed_nodes[0] == (0, "task")
 
+    srvres.lattice.transport_graph.set_node_value(1, "status", SDKResult.CANCELLED)
+    incomplete_nodes = srvres._get_incomplete_nodes()
+    assert incomplete_nodes["failed"] == [(0, "task")]
+    assert [node_id for node_id, _ in incomplete_nodes["cancelled"]] == [1]
+
 
 def test_get_all_node_outputs(test_db, mocker):
     res = get_mock_result()
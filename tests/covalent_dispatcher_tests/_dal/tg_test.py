@@ -132,6 +132,13 @@ def test_transport_graph_get_set(bare_mode, test_db, mocker):
     assert tg.get_node_value(0, "status") == SDKResult.COMPLETED
     assert tg.get_node_value(0, "end_time") == ts
 
+    tg.set_node_values(1, {"start_time": ts, "end_time": ts, "status": SDKResult.FAILED})
+    assert tg.get_values_for_nodes([1], ["start_time", "end_time", "status"])[0] == {
+        "start_time": ts,
+        "end_time": ts,
+        "status": SDKResult.FAILED,
+    }
+
     # Check handling of invalid node id
     with pytest.raises(KeyError):
         tg.get_node_value(-5, "name")
@@ -161,6 +168,7 @@ def test_transport_graph_get_internal_graph_copy(test_db, mocker):
 
     assert g.nodes == tg._graph.nodes
     assert g.edges == tg._graph.edges
+    assert tg.node_ids() == list(g.nodes)
 
 
 @pytest.mark.parametrize("bare_mode", [False, True])
@@ -27,7 +27,7 @@ from alembic.script import ScriptDirectory
 from sqlalchemy import select
 
 from covalent_dispatcher._db import models
-from covalent_dispatcher._db.datastore import DataStore
+from covalent_dispatcher._db.datastore import DataStore, _pool_options
 
 from .fixtures import workflow_fixture
 
@@ -65,6 +65,22 @@ def test_default_db_path(db: DataStore, tmp_path: Path, mocker):
     assert DataStore().db_URL == db_url
 
 
+def test_pool_options(mocker):
+    mocker.patch("covalent_dispatcher._db.datastore.get_config", return_value=10)
+
+    sqlite_options = _pool_options("sqlite+pysqlite:///:memory:")
+    assert sqlite_options == {"pool_pre_ping": True, "pool_recycle": 10}
+
+    pg_options = _pool_options("postgresql://localhost/covalent")
+    assert pg_options == {
+        "pool_pre_ping": True,
+        "pool_recycle": 10,
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+    }
+
+
 def test_run_migrations(db: DataStore, mocker):
     config_mock = Mock()
     command_mock = mocker.patch("covalent_dispatcher._db.datastore.command")
@@ -62,3 +62,11 @@ def test_store_and_load_file():
         data = None
         local_store.store_file(storage_path=temp_dir, filename="pickle.txt", data=data)
         assert local_store.load_file(storage_path=temp_dir, filename="pickle.txt") == ""
+
+
+def test_store_file_digest():
+    """Test that the digest of a stored file matches its contents."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        digest = local_store.store_file(storage_path=temp_dir, filename="data.json", data=[1, 2])
+        assert digest == local_store.digest(bucket_name=temp_dir, object_key="data.json")
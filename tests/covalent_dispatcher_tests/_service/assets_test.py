@@ -16,6 +16,8 @@
 
 """Unit tests for the FastAPI asset endpoints"""
 
+import io
+import tarfile
 import tempfile
 from contextlib import contextmanager
 from typing import Generator
@@ -30,6 +32,7 @@ from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from covalent._workflow.transportable_object import TransportableObject
 from covalent_dispatcher._service.assets import (
     _generate_file_slice,
+    _generate_tar_stream,
     _get_tobj_pickle_offsets,
     _get_tobj_string_offsets,
     get_cached_result_object,
@@ -732,6 +735,45 @@ def test_generate_whole_file_slice():
         assert next(gen) == data
 
 
+def test_get_node_assets(mocker, client, test_db, mock_result_object):
+    """Test getting an asset for several nodes at once."""
+
+    key = "output"
+    dispatch_id = "test_get_node_assets"
+    mock_generate_tar_stream = mocker.patch(
+        "covalent_dispatcher._service.assets._generate_tar_stream", return_value=iter([b"Hi"])
+    )
+    mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._service.assets.get_result_object", return_value=mock_result_object
+    )
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+
+    resp = client.post(f"/api/v2/dispatches/{dispatch_id}/electrons/assets/{key}", json=[0, 1])
+
+    assert resp.content == b"Hi"
+    mock_generate_tar_stream.assert_called_with({"0": INTERNAL_URI, "1": INTERNAL_URI})
+
+
+def test_generate_tar_stream():
+    """Test streaming several files as a tar archive."""
+
+    contents = {"0": b"", "1": b"x" * 513, "2": b"test_generate_tar_stream"}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_urls = {}
+        for name, data in contents.items():
+            with open(f"{tmp_dir}/{name}", "wb") as f:
+                f.write(data)
+            file_urls[name] = f"file://{tmp_dir}/{name}"
+
+        archive = io.BytesIO(b"".join(_generate_tar_stream(file_urls, 256)))
+
+    with tarfile.open(fileobj=archive, mode="r|") as tar:
+        extracted = {member.name: tar.extractfile(member).read() for member in tar}
+
+    assert extracted == contents
+
+
 def test_get_cached_result_obj(mocker, test_db):
     mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
     mocker.patch("covalent_dispatcher._service.assets.get_result_object", side_effect=KeyError())
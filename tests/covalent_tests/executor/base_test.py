@@ -73,6 +73,17 @@ def test_write_streams_to_file(mocker):
             lines = f.readlines()
         assert lines[0] == "absolute"
 
+    # Case 3 - Check that log files in the home directory are written to the expanded path.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mocker.patch.dict(os.environ, {"HOME": tmp_dir})
+        me.write_streams_to_file(
+            stream_strings=["home"], filepaths=["~/home.log"], dispatch_id="", results_dir=""
+        )
+
+        with open(f"{tmp_dir}/home.log") as f:
+            lines = f.readlines()
+        assert lines[0] == "home"
+
 
 def test_wrapper_fn():
     import tempfile
@@ -126,6 +137,21 @@ def test_wrapper_fn():
     Path(tmp_path_after).unlink()
 
 
+def test_wrapper_fn_without_deps():
+    """Test executing a task without call_before or call_after deps"""
+
+    def f(x, y=0):
+        return x * y
+
+    serialized_fn = TransportableObject(f)
+    args = [TransportableObject(3)]
+    kwargs = {"y": TransportableObject(4)}
+
+    output = wrapper_fn(serialized_fn, [], [], *args, **kwargs)
+
+    assert output.get_deserialized() == 12
+
+
 def test_wrapper_fn_calldep_retval_injection():
     """Test injecting calldep return values into main task"""
 
@@ -167,6 +193,47 @@ def test_wrapper_fn_calldep_non_unique_retval_keys_injection():
     assert output.get_deserialized() == 6
 
 
+def test_wrapper_fn_deserializes_shared_objects_once(mocker):
+    """Test that a TransportableObject passed several times is deserialized once"""
+
+    def f(x=0, y=[]):
+        return x + sum(y)
+
+    def identity(y):
+        return y
+
+    serialized_fn = TransportableObject(f)
+    calldep = DepsCall(identity, args=[1], retval_keyword="y")
+    call_before = [calldep.apply(), calldep.apply()]
+    kwargs = {"x": TransportableObject(3)}
+
+    spy = mocker.spy(TransportableObject, "get_deserialized")
+    output = wrapper_fn(serialized_fn, call_before, [], **kwargs)
+
+    # fn, x, and the dep's callable, args, and kwargs
+    assert spy.call_count == 5
+    assert output.get_deserialized() == 5
+
+
+def test_wrapper_fn_task_args_not_shared():
+    """Test that a task argument passed twice is deserialized into independent objects"""
+
+    def f(x, y):
+        x.append(1)
+        return y
+
+    def noop():
+        pass
+
+    serialized_fn = TransportableObject(f)
+    arg = TransportableObject([])
+    call_before = [DepsCall(noop).apply()]
+
+    output = wrapper_fn(serialized_fn, call_before, [], arg, arg)
+
+    assert output.get_deserialized() == []
+
+
 def test_base_executor_subclassing():
     """Test that executors must implement run"""
 
@@ -526,6 +593,19 @@ def test_executor_from_dict_makes_deepcopy():
     assert "_state" not in object_dict["attributes"]
 
 
+def test_executor_from_dict_copies_nested_attributes():
+    """Check that mutable attribute values are not shared with the
+    provided metadata when rehydrating an executor.
+    """
+
+    me = MockExecutor(log_stdout="/tmp/stdout.log")
+    me.options = {"nested": [1, 2]}
+    object_dict = me.to_dict()
+    me = me.from_dict(object_dict)
+    me.options["nested"].append(3)
+    assert object_dict["attributes"]["options"] == {"nested": [1, 2]}
+
+
 def test_executor_execute_runtime_error_handling(mocker):
     """Check handling of `TaskRuntimeError` exceptions"""
 
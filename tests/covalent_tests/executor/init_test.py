@@ -16,6 +16,7 @@
 
 """Tests for Covalent executor init file."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -23,6 +24,13 @@ import pytest
 from covalent.executor import BaseExecutor, _executor_manager, _ExecutorManager
 
 
+@pytest.fixture
+def executor_manager():
+    """Rebuild the executor manager singleton, and with it the module exports, around a test."""
+    yield _ExecutorManager()
+    _ExecutorManager()
+
+
 def test_get_executor_local(mocker):
     """Test that config is reloaded when the get_executor method is called for the local executor."""
 
@@ -125,7 +133,7 @@ def test_warning_when_plugin_name_is_invalid(mocker):
     em = _ExecutorManager()
     the_module = MagicMock()
     the_module.__name__ = "test_module"
-    em._is_plugin_name_valid = MagicMock(return_value=False)
+    mocker.patch.object(em, "_get_plugin_name", return_value=None)
     app_log_mock = mocker.patch("covalent.executor.app_log")
 
     em._populate_executor_map_from_module(the_module)
@@ -133,18 +141,55 @@ def test_warning_when_plugin_name_is_invalid(mocker):
     app_log_mock.warning.assert_called_once()
 
 
+def test_get_plugin_name():
+    """Test that the plugin name is read from either module attribute."""
+    em = _ExecutorManager()
+
+    assert em._get_plugin_name(SimpleNamespace(EXECUTOR_PLUGIN_NAME="MockExecutor")) == (
+        "MockExecutor"
+    )
+    assert em._get_plugin_name(SimpleNamespace(executor_plugin_name="MockExecutor")) == (
+        "MockExecutor"
+    )
+    assert em._get_plugin_name(SimpleNamespace()) is None
+
+
 def test_zero_plugin_class_else_case(mocker):
     """Test else block when no plugin classes were found"""
     em = _ExecutorManager()
     the_module = MagicMock()
     the_module.__name__ = "test_module"
-    em._is_plugin_name_valid = MagicMock(return_value=True)
-    em.nonzero_plugin_classes = MagicMock(return_value=False)
+    mocker.patch.object(em, "_get_plugin_name", return_value="MockExecutor")
     app_log_mock = mocker.patch("covalent.executor.app_log")
 
-    mocker.patch("covalent.executor.inspect.getmembers")
-
     em._populate_executor_map_from_module(the_module)
 
-    em.nonzero_plugin_classes.assert_called_once()
+    assert "test_module" not in em.executor_plugins_map
     app_log_mock.warning.assert_called_once()
+
+
+def test_executor_plugins_exported_lazily(executor_manager):
+    """Test that the executor manager and plugin classes are exposed as module attributes."""
+    import covalent.executor as executor_module
+
+    assert executor_module._executor_manager is executor_manager
+    assert executor_module.LocalExecutor is executor_manager.executor_plugins_map["local"]
+    assert "LocalExecutor" in dir(executor_module)
+
+    with pytest.raises(AttributeError):
+        executor_module.NonExistentExecutor
+
+
+def test_executor_plugins_reexported_on_regeneration(mocker, executor_manager):
+    """Test that the module exports follow the executor map when the manager is rebuilt."""
+    import covalent.executor as executor_module
+
+    mocker.patch("covalent.executor._ExecutorManager.generate_plugins_list")
+    _ExecutorManager()
+
+    assert not hasattr(executor_module, "LocalExecutor")
+
+    mocker.stopall()
+    _ExecutorManager()
+
+    assert executor_module.LocalExecutor is executor_manager.executor_plugins_map["local"]
@@ -16,7 +16,9 @@
 
 """Tests for results manager."""
 
+import io
 import os
+import tarfile
 import tempfile
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
@@ -32,6 +34,7 @@ from covalent._results_manager.results_manager import (
     _get_result_export_from_dispatcher,
     cancel,
     download_asset,
+    download_node_assets_bulk,
     get_result,
 )
 from covalent._serialize.result import serialize_result
@@ -151,6 +154,22 @@ def test_result_manager_assets_local_copies():
         assert output.get_deserialized() == 2
 
 
+def test_result_manager_download_node_assets(mocker):
+    """Test downloading an asset for several nodes at once."""
+    with tempfile.TemporaryDirectory() as server_dir:
+        manifest = get_test_manifest(server_dir)
+        with tempfile.TemporaryDirectory() as results_dir:
+            rm = ResultManager(manifest, results_dir)
+            mock_download = mocker.patch.object(rm, "download_node_asset")
+            rm.download_node_assets([0, 1, 2], "output")
+
+    assert sorted(mock_download.mock_calls) == [
+        mocker.call(0, "output"),
+        mocker.call(1, "output"),
+        mocker.call(2, "output"),
+    ]
+
+
 def test_result_manager_save_manifest():
     """Test saving and loading manifests"""
     dispatch_id = "test_result_manager_save_load"
@@ -294,3 +313,33 @@ def test_download_asset(mocker):
     with tempfile.NamedTemporaryFile() as local_file:
         download_asset(remote_uri, local_file.name)
         assert local_file.read().decode("utf-8") == "Hello"
+
+
+def test_download_node_assets_bulk(mocker):
+    """Test downloading an asset for several nodes from the bulk endpoint."""
+    dispatch_id = "test_download_node_assets_bulk"
+    endpoint = f"/api/v2/dispatches/{dispatch_id}/electrons/assets/output"
+
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        for node_id, data in ((0, b"Hello"), (1, b"World")):
+            tarinfo = tarfile.TarInfo(str(node_id))
+            tarinfo.size = len(data)
+            tar.addfile(tarinfo, io.BytesIO(data))
+    archive.seek(0)
+
+    mock_client = MagicMock()
+    mock_client.post.return_value.raw = archive
+    mocker.patch(
+        "covalent._results_manager.results_manager.CovalentAPIClient", return_value=mock_client
+    )
+
+    with tempfile.TemporaryDirectory() as results_dir:
+        local_paths = {0: f"{results_dir}/0", 1: f"{results_dir}/1"}
+        download_node_assets_bulk("http://localhost:48008", endpoint, local_paths)
+
+        mock_client.post.assert_called_with(endpoint, json=[0, 1], stream=True)
+        with open(local_paths[0], "rb") as f:
+            assert f.read() == b"Hello"
+        with open(local_paths[1], "rb") as f:
+            assert f.read() == b"World"
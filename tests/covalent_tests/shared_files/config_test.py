@@ -266,3 +266,14 @@ def test_config_manager_set(mocker, config_manager):
         "mock_section": {"mock_dir": "final_value", "new_mock_dir": "mock_value"},
         "new_mock_section": {"new_mock_dir": {"new_mock_dir": "mock_value"}},
     }
+
+
+def test_config_change_hooks(mocker, config_manager):
+    """Test that registered hooks are invoked when the config changes."""
+
+    hook = mocker.MagicMock()
+    mocker.patch("covalent._shared_files.config._config_change_hooks", [hook])
+
+    cm = config_manager
+    cm.set("dispatcher.port", 12345)
+    hook.assert_called_once_with()
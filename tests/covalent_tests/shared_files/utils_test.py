@@ -17,10 +17,21 @@
 
 """Unit tests for Covalent shared util functions."""
 
+from datetime import timedelta
+
 import pytest
 
+import covalent as ct
 from covalent._shared_files.config import get_config
-from covalent._shared_files.utils import filter_null_metadata, format_server_url
+from covalent._shared_files.utils import (
+    filter_null_metadata,
+    format_server_url,
+    _get_source,
+    get_named_params,
+    get_serialized_function_str,
+    get_time,
+    get_timedelta,
+)
 
 
 @pytest.mark.parametrize(
@@ -46,3 +57,70 @@ def test_format_server_url():
     port = int(get_config("dispatcher.port"))
 
     assert base_url == f"http://{addr}:{port}"
+
+
+@pytest.mark.parametrize(
+    "hostname,port,expected",
+    [
+        ("localhost", 48008, "http://localhost:48008"),
+        ("localhost", 443, "https://localhost"),
+        ("http://localhost/api/", 80, "http://localhost/api"),
+        ("https://example.com/api", 8443, "https://example.com:8443/api"),
+    ],
+)
+def test_format_server_url_explicit(hostname, port, expected):
+    """Test formatting server urls from an explicit hostname and port."""
+    assert format_server_url(hostname, port) == expected
+
+
+def test_get_named_params_keyword_only():
+    """Test that keyword-only arguments are matched by name."""
+
+    def func(a, *, b):
+        pass
+
+    assert get_named_params(func, (1,), {"b": 2}) == ({"a": 1}, {"b": 2})
+
+    with pytest.raises(ValueError, match="Unexpected keyword arguments: c"):
+        get_named_params(func, (1,), {"b": 2, "c": 3})
+
+
+def test_get_named_params_var_keyword():
+    """Test that extra keyword arguments are absorbed by **kwargs."""
+
+    def func(a, *args, b=1, **kwargs):
+        pass
+
+    named_args, named_kwargs = get_named_params(func, (1, 2), {"b": 3, "c": 4})
+    assert named_args == {"a": 1, "arg[1]": 2}
+    assert named_kwargs == {"b": 3, "c": 4}
+
+
+@pytest.mark.parametrize(
+    "time_limit,expected",
+    [
+        ("00-00:00:01", timedelta(seconds=1)),
+        ("01-02:03:04", timedelta(days=1, hours=2, minutes=3, seconds=4)),
+        ("120-23:59:59", timedelta(days=120, hours=23, minutes=59, seconds=59)),
+    ],
+)
+def test_time_limit_round_trip(time_limit, expected):
+    """Test the conversion between time limit strings and timedeltas."""
+    assert get_timedelta(time_limit) == expected
+    assert get_time(expected) == time_limit
+
+
+def test_serialized_function_str_cache_hits_for_lattices():
+    """Test that source lookups are reused although the lattice function is re-created."""
+
+    @ct.lattice
+    def workflow(x):
+        return x
+
+    _get_source.cache_clear()
+    first = get_serialized_function_str(workflow)
+    second = get_serialized_function_str(workflow)
+
+    assert first == second
+    assert "def workflow(x):" in first
+    assert _get_source.cache_info().hits == 1
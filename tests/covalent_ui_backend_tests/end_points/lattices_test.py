@@ -15,9 +15,16 @@
 # limitations under the License.
 
 """Lattices test"""
+import json
 from os.path import abspath, dirname
 
 import pytest
+from sqlalchemy.orm import Session
+
+import covalent_ui.api.v1.database.config.db as db
+from covalent_ui.api.v1.data_layer.lattice_dal import Lattices
+from covalent_ui.api.v1.models.lattices_model import SubLatticeSortBy
+from covalent_ui.api.v1.utils.models_helper import SortDirection
 
 from .. import fastapi_app
 from ..utils.assert_data.lattices import seed_lattice_data
@@ -232,3 +239,66 @@ def test_sublattices_queries():
     assert response.status_code == test_data["status_code"]
     if test_data["response_data"]:
         assert response.json() == test_data["response_data"]
+
+
+def test_sublattices_pagination():
+    """Test sublattices with pagination"""
+    test_data = output_data["test_sublattices"]["case3"]
+    response = object_test_template(
+        api_path=output_data["test_sublattices"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+        query_data=test_data["query_data"],
+    )
+    assert response.status_code == test_data["status_code"]
+    if test_data["response_data"]:
+        assert response.json() == test_data["response_data"]
+
+
+def test_sublattices_stream():
+    """Test streaming sublattices"""
+    test_data = output_data["test_sublattices"]["case1"]
+    response = object_test_template(
+        api_path=output_data["test_sublattices"]["api_path"] + "/stream",
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+    )
+    assert response.status_code == test_data["status_code"]
+    if test_data["response_data"]:
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == test_data["response_data"]["sub_lattices"]
+
+
+def test_sub_lattice_details_batch():
+    """Test fetching sublattices of several root dispatches at once"""
+    root_dispatch_id = "a95d84ad-c441-446d-83ae-46380dcdf38e"
+    missing_dispatch_id = "00000000-0000-0000-0000-000000000000"
+
+    with Session(db.engine) as session:
+        lattice = Lattices(session)
+        assert lattice.get_sub_lattice_details_batch([]) == {}
+
+        ascending = lattice.get_sub_lattice_details_batch(
+            [root_dispatch_id, missing_dispatch_id],
+            sort_by=SubLatticeSortBy.TOTAL_ELECTRONS,
+            sort_direction=SortDirection.ASCENDING,
+        )
+        descending = lattice.get_sub_lattice_details_batch(
+            [root_dispatch_id],
+            sort_by=SubLatticeSortBy.TOTAL_ELECTRONS,
+            sort_direction=SortDirection.DESCENDING,
+        )
+
+    assert set(ascending) == {root_dispatch_id, missing_dispatch_id}
+    assert ascending[missing_dispatch_id] == []
+    assert [row.dispatch_id for row in ascending[root_dispatch_id]] == [
+        "89be0bcf-95dd-40a6-947e-6af6c56f147d",
+        "69dec597-79d9-4c99-96de-8d5f06f3d4dd",
+    ]
+    assert [row.dispatch_id for row in descending[root_dispatch_id]] == [
+        "69dec597-79d9-4c99-96de-8d5f06f3d4dd",
+        "89be0bcf-95dd-40a6-947e-6af6c56f147d",
+    ]
+    assert all(row.root_dispatch_id == root_dispatch_id for row in ascending[root_dispatch_id])
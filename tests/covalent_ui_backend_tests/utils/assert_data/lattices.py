@@ -209,6 +209,31 @@ def seed_lattice_data():
                     ]
                 },
             },
+            "case3": {
+                "status_code": 200,
+                "path": {"dispatch_id": "a95d84ad-c441-446d-83ae-46380dcdf38e"},
+                "query_data": {
+                    "sort_by": "total_electrons",
+                    "sort_direction": "ASC",
+                    "count": 1,
+                    "offset": 1,
+                },
+                "response_data": {
+                    "sub_lattices": [
+                        {
+                            "dispatch_id": "69dec597-79d9-4c99-96de-8d5f06f3d4dd",
+                            "lattice_name": "sub",
+                            "runtime": 5000,
+                            "total_electrons": 120,
+                            "total_electrons_completed": 120,
+                            "started_at": "2022-10-27T10:08:38.759335",
+                            "ended_at": "2022-10-27T10:08:43.877056",
+                            "status": "COMPLETED",
+                            "updated_at": "2022-10-27T10:08:43.890454",
+                        },
+                    ]
+                },
+            },
         },
         "functional_test_lattices": {"case1": {"dispatch_id": VALID_DISPATCH_ID, "lattice_id": 1}},
     }
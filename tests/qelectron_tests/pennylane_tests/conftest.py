@@ -24,10 +24,10 @@ Configuration that enables easy adoption of Pennylane tests to QElectrons.
 NOTE: ONLY USE this configuration file with Pennylane tests.
 """
 
+import functools
 import inspect
 import re
 from typing import List
-from unittest.mock import patch
 
 import pennylane as qml
 import pytest
@@ -38,11 +38,18 @@ from covalent.quantum.qcluster.simulator import SIMULATOR_DEVICES
 
 SKIP_RETURN_TYPES = ["qml.apply", "qml.vn_entropy", "qml.mutual_info"]
 
-SKIP_DEVICES = [
-    "default.qutrit",
-    "default.mixed",
-    "default.gaussian",  # TODO: allow for Simulator
-]
+# Unqualified names (e.g. "apply") also match the qualified ones ("qml.apply")
+_SKIP_RETURN_NAMES = {ret_typ.split(".", maxsplit=1)[-1]: ret_typ for ret_typ in SKIP_RETURN_TYPES}
+_SKIP_RETURN_RE = re.compile("|".join(map(re.escape, _SKIP_RETURN_NAMES)))
+_RETURN_LINE_RE = re.compile(r"^\s*return", re.MULTILINE)
+
+SKIP_DEVICES = frozenset(
+    {
+        "default.qutrit",
+        "default.mixed",
+        "default.gaussian",  # TODO: allow for Simulator
+    }
+)
 
 # XFAIL NOTES LEGEND
 # (1) configuration issue; test passes manually
@@ -70,6 +77,9 @@ XFAIL_TEST_NAMES = [
     "TestHamiltonian::test_hamiltonian_isub",
 ]
 
+# Matches a node id containing any of the names above in a single pass
+_XFAIL_TEST_NAMES_RE = re.compile("|".join(map(re.escape, XFAIL_TEST_NAMES)))
+
 XFAIL_TEST_NAMES_CONDITIONAL = {
     # NOTE: mocker.spy(qml.QubitDevice, "probability") working incorrectly for Braket executor.
     "test_numerical_analytic_diff_agree": lambda item: (
@@ -95,26 +105,36 @@ SKIP_FOR_RUN_LATER = [
     "test_iqp_emb.py::TestInterfaces::test_jax",
 ]
 
+_SKIP_FOR_RUN_LATER_RE = re.compile("|".join(map(re.escape, SKIP_FOR_RUN_LATER)))
+_XFAIL_TEST_NAMES_CONDITIONAL_RE = re.compile(
+    "|".join(map(re.escape, XFAIL_TEST_NAMES_CONDITIONAL))
+)
+
 
 # VALIDATION FUNCTIONS
 # ------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_source(code_obj):
+    """
+    Returns the source of a function's code object, read once per function.
+    """
+    return "".join(inspect.getsourcelines(code_obj)[0])
+
+
 def _check_return_type(executors, func):
     """
     Checks whether a function returns a type that is not supported by QElectrons.
     """
 
-    func_lines = inspect.getsourcelines(func)[0]
-    reached_return = False
-    for line in func_lines:
-        if line.strip().startswith("return"):
-            reached_return = True
-
-        if reached_return:
-            for ret_typ in SKIP_RETURN_TYPES:
-                if ret_typ in line or ret_typ.split(".", maxsplit=1)[-1] in line:
-                    pytest.skip(f"QElectrons don't support `{ret_typ}` measurements.")
+    func_source = _get_source(func.__code__)
+    return_match = _RETURN_LINE_RE.search(func_source)
+    if return_match:
+        skip_match = _SKIP_RETURN_RE.search(func_source, return_match.start())
+        if skip_match:
+            ret_typ = _SKIP_RETURN_NAMES[skip_match.group()]
+            pytest.skip(f"QElectrons don't support `{ret_typ}` measurements.")
 
 
 def _check_device_type(executors, device):
@@ -201,9 +221,12 @@ def _init_LocalBraketQubitExecutor_cluster(shots):
 # ------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def _get_wrapped_QNode(use_run_later, get_executors):  # pylint: disable=invalid-name
     """
     Patches `qml.QNode` to return a QElectron instead.
+
+    Cached so that each (use_run_later, get_executors) pair builds its class once.
     """
 
     class _PatchedQNode(qml.QNode):
@@ -265,14 +288,14 @@ def pytest_collection_modifyitems(
     """
     for item in items:
         # XFail tests expected to fail in general.
-        if any(name in item.nodeid for name in XFAIL_TEST_NAMES):
+        if _XFAIL_TEST_NAMES_RE.search(item.nodeid):
             item.add_marker(pytest.mark.xfail(reason="XFailing test also failed by normal QNode."))
 
         # XFail tests expected to fail with `QElectron.run_later`
         if (
             "use_run_later" in item.fixturenames
             and item.callspec.params.get("use_run_later")
-            and any(name in item.nodeid for name in SKIP_FOR_RUN_LATER)
+            and _SKIP_FOR_RUN_LATER_RE.search(item.nodeid)
         ):
             item.add_marker(
                 pytest.mark.skip(
@@ -281,7 +304,7 @@ def pytest_collection_modifyitems(
             )
 
         # XFail tests expected to fail in certain conditions.
-        if any(name in item.nodeid for name in XFAIL_TEST_NAMES_CONDITIONAL):
+        if _XFAIL_TEST_NAMES_CONDITIONAL_RE.search(item.nodeid):
             condition = XFAIL_TEST_NAMES_CONDITIONAL[_get_test_name(item)]
             if condition(item):
                 item.add_marker(pytest.mark.xfail(reason="XFailing conditional case."))
@@ -323,6 +346,9 @@ def patch_qnode_creation(use_run_later, get_executors):
     Wraps the `pennylane.QNode` class such that the `qml.qnode()` decorator
     instead creates QElectrons that wrap a QNode.
     """
-    patched_cls = _get_wrapped_QNode(use_run_later, get_executors)
-    with patch("pennylane.QNode", new=patched_cls):
+    original_cls = qml.QNode
+    qml.QNode = _get_wrapped_QNode(use_run_later, get_executors)
+    try:
         yield
+    finally:
+        qml.QNode = original_cls
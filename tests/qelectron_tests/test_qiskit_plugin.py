@@ -157,3 +157,56 @@ def test_template_circuits(template, executor_class):
 
     assert isinstance(val_2, type(val_1))
     assert np.isclose(val_1, val_2, atol=0.1).all()
+
+
+def test_compile_circuits_cache():
+    """
+    Check that compiling the same circuit twice reuses the cached compilation
+    while still resetting the device and returning independent circuits.
+    """
+    # Importable once covalent has loaded the Qiskit plugin.
+    from devices_base import _compiled_circuits
+    from local_sampler import QiskitLocalSampler
+
+    device = QiskitLocalSampler(wires=2, shots=1024)
+    tape = qml.tape.QuantumScript(
+        [qml.RX(0.5, wires=0), qml.CNOT(wires=[0, 1])], [qml.probs(wires=[0, 1])]
+    )
+
+    _compiled_circuits.clear()
+
+    first = device.compile_circuits([tape])[0]
+    first_device_circuit = device._circuit
+
+    second = device.compile_circuits([tape])[0]
+
+    assert len(_compiled_circuits) == 1
+    assert device._circuit is not first_device_circuit
+    assert second is not first
+    assert second == first
+
+    first.name = "renamed"
+    assert second.name == "circ0"
+    assert all(circ.name != "renamed" for circ in _compiled_circuits.values())
+
+
+def test_close_cached_sessions_continues_on_error(mocker):
+    """
+    Check that a session failing to close does not prevent closing the rest.
+    """
+    # Importable once covalent has loaded the Qiskit plugin.
+    from sessions import _sessions, close_cached_sessions
+
+    failing = mocker.MagicMock()
+    failing.close.side_effect = RuntimeError("session already expired")
+    healthy = mocker.MagicMock()
+
+    _sessions.clear()
+    _sessions["failing"] = failing
+    _sessions["healthy"] = healthy
+
+    close_cached_sessions()
+
+    failing.close.assert_called_once()
+    healthy.close.assert_called_once()
+    assert not _sessions